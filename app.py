@@ -8,20 +8,23 @@ It uses modular components from the ui/ directory and the app_controller.py.
 import streamlit as st
 import pandas as pd
 import os
-import matplotlib.pyplot as plt
+import matplotlib
+
+# Render plots off-screen with Agg and simplify long line paths before any
+# module imports pyplot
+matplotlib.use('Agg')
+matplotlib.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+})
 from financeModels.file_handler import load_csv, save_csv, load_json, save_json
 
 # Import the controller
 from app_controller import AppController, CSV_FILES
 
-# Import UI modules (uncomment as they are created)
-from ui.revenue_tab import render_revenue_tab
-from ui.equipment_tab import render_equipment_tab
-from ui.personnel_tab import render_personnel_tab
-from ui.exams_tab import render_exams_tab
-from ui.other_expenses_tab import render_other_expenses_tab
-from ui.plots_tab import render_plots_tab
-from ui.comprehensive_tab import render_comprehensive_tab
+# Import the UI package; each tab module is imported the first time its tab is opened
+import ui
 
 # Set page configuration
 st.set_page_config(
@@ -36,7 +39,8 @@ AppController.initialize_session_state()
 # Add a reload data button in the sidebar
 with st.sidebar:
     if st.button("🔄 Reload All Data"):
-        # Reload all data from CSV files
+        # Reload all data from CSV files, bypassing the load cache
+        AppController.clear_data_cache()
         AppController.load_all_data()
         st.success("All data reloaded from CSV files!")
     
@@ -62,41 +66,25 @@ if 'dataframes' not in st.session_state or not st.session_state.dataframes:
         # Initialize empty dataframes
         st.session_state.dataframes = {}
 
-# Create tabs
-tabs = st.tabs([
-    "Revenue", 
-    "Equipment", 
-    "Personnel", 
-    "Exams",
-    "Other Expenses",
-    "Summary Plots",
-    "Comprehensive ProForma"
-])
-
-# Revenue tab
-with tabs[0]:
-    render_revenue_tab(st)
-
-# Equipment tab
-with tabs[1]:
-    render_equipment_tab(st)
-
-# Personnel tab
-with tabs[2]:
-    render_personnel_tab(st)
-
-# Exams tab
-with tabs[3]:
-    render_exams_tab(st)
-
-# Other Expenses tab
-with tabs[4]:
-    render_other_expenses_tab(st)
-
-# Summary Plots tab
-with tabs[5]:
-    render_plots_tab(st)
+# Tab navigation. Only the selected tab is imported and rendered on each rerun,
+# so the data editors, plots and models of the other tabs do no work until they
+# are opened.
+TABS = {
+    "Revenue": "render_revenue_tab",
+    "Equipment": "render_equipment_tab",
+    "Personnel": "render_personnel_tab",
+    "Exams": "render_exams_tab",
+    "Other Expenses": "render_other_expenses_tab",
+    "Summary Plots": "render_plots_tab",
+    "Comprehensive ProForma": "render_comprehensive_tab"
+}
+
+active_tab = st.radio(
+    "Tab",
+    list(TABS.keys()),
+    horizontal=True,
+    label_visibility="collapsed",
+    key="active_tab"
+)
 
-# Comprehensive ProForma tab
-with tabs[6]:
-    render_comprehensive_tab(st) 
\ No newline at end of file
+getattr(ui, TABS[active_tab])(st)
@@ -5,12 +5,15 @@ This module manages the application state and provides functions to interact wit
 the financial models and data storage.
 """
 
+import os
 import pandas as pd
 import streamlit as st
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from typing import Dict, List, Optional, Any, Tuple
 
 from financeModels.file_handler import (
-    load_csv, save_csv, load_json, save_json,
+    load_csv, save_csv, load_json, save_json, update_json_entry,
     sync_json_to_csv, sync_csv_to_json,
     update_csv_from_dataframes, update_json_from_csvs
 )
@@ -26,6 +29,63 @@ CSV_FILES = {
 
 JSON_FILE = "carescan_data.json"
 
+@st.cache_data(show_spinner=False)
+def _load_csv_cached(filepath: str, mtime: float) -> pd.DataFrame:
+    """Load a CSV file, cached on its path and modification time."""
+    return load_csv(filepath)
+
+@st.cache_data(show_spinner=False)
+def _load_json_cached(filepath: str, mtime: float) -> Dict[str, pd.DataFrame]:
+    """Load the JSON data file, cached on its path and modification time."""
+    return load_json(filepath)
+
+def load_csv_cached(filepath: str) -> pd.DataFrame:
+    """
+    Load a CSV file, reusing the cached DataFrame while the file is unchanged.
+    
+    Args:
+        filepath: Path to the CSV file
+        
+    Returns:
+        DataFrame containing the CSV data
+    """
+    return _load_csv_cached(filepath, os.path.getmtime(filepath))
+
+def load_json_cached(filepath: str) -> Dict[str, pd.DataFrame]:
+    """
+    Load the JSON data file, reusing the cached result while the file is unchanged.
+    
+    Args:
+        filepath: Path to the JSON file
+        
+    Returns:
+        Dictionary mapping names to DataFrames
+    """
+    return _load_json_cached(filepath, os.path.getmtime(filepath))
+
+def _json_entry_state(df: pd.DataFrame) -> Tuple:
+    """
+    Identify a dataset's content together with the JSON file version it was written to.
+    
+    Args:
+        df: DataFrame being saved
+        
+    Returns:
+        Hashable tuple of the column names, the per-row hashes in row order and the
+        JSON file's modification time
+    """
+    mtime = os.path.getmtime(JSON_FILE) if os.path.exists(JSON_FILE) else None
+    return (tuple(map(str, df.columns)),
+            pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes(),
+            mtime)
+
+def _try_load_csv(filepath: str) -> Tuple[Optional[pd.DataFrame], Optional[Exception]]:
+    """Load a CSV file, returning the error instead of raising it."""
+    try:
+        return load_csv_cached(filepath), None
+    except Exception as e:
+        return None, e
+
 class AppController:
     """Controller class for managing app state and interactions."""
     
@@ -41,17 +101,29 @@ class AppController:
         if 'calculation_results' not in st.session_state:
             st.session_state.calculation_results = {}
     
+    @staticmethod
+    def clear_data_cache():
+        """Drop cached file loads so the next load re-reads from disk."""
+        _load_csv_cached.clear()
+        _load_json_cached.clear()
+    
     @staticmethod
     def load_all_data():
         """Load all data from CSV files into session state."""
         AppController.initialize_session_state()
         
-        for name, filepath in CSV_FILES.items():
-            try:
-                df = load_csv(filepath)
+        # Load the files concurrently; the worker threads share this script
+        # run's context so the cached loader works in them
+        with ThreadPoolExecutor(max_workers=len(CSV_FILES),
+                                initializer=add_script_run_ctx,
+                                initargs=(None, get_script_run_ctx())) as executor:
+            loaded = list(executor.map(_try_load_csv, CSV_FILES.values()))
+        
+        for name, (df, error) in zip(CSV_FILES.keys(), loaded):
+            if error is not None:
+                st.error(f"Error loading {name}: {error}")
+            else:
                 st.session_state.dataframes[name] = df
-            except Exception as e:
-                st.error(f"Error loading {name}: {e}")
         
         st.session_state.loaded_from = 'csv'
         return st.session_state.dataframes
@@ -60,7 +132,7 @@ class AppController:
     def load_from_json():
         """Load all data from JSON file into session state."""
         try:
-            data_dict = load_json(JSON_FILE)
+            data_dict = load_json_cached(JSON_FILE)
             
             # If we got an empty dictionary, it means JSON loading failed
             if not data_dict:
@@ -89,8 +161,18 @@ class AppController:
             # Save to CSV
             save_result = save_csv(df, CSV_FILES[name])
             
-            # Update JSON file
-            json_result = save_json(st.session_state.dataframes, JSON_FILE)
+            # Update only this dataset in the JSON file, rewriting it in
+            # full if it is missing or unreadable. Saving unchanged data to an
+            # untouched file is skipped.
+            json_written = st.session_state.setdefault('json_written', {})
+            if json_written.get(name) == _json_entry_state(df):
+                json_result = True
+            else:
+                try:
+                    json_result = update_json_entry(name, df, JSON_FILE)
+                except IOError:
+                    json_result = save_json(st.session_state.dataframes, JSON_FILE)
+                json_written[name] = _json_entry_state(df)
             
             return save_result and json_result
         except Exception as e:
@@ -106,7 +188,7 @@ class AppController:
             # Try to load from CSV
             if name in CSV_FILES:
                 try:
-                    df = load_csv(CSV_FILES[name])
+                    df = load_csv_cached(CSV_FILES[name])
                     st.session_state.dataframes[name] = df
                     return df
                 except Exception as e:
@@ -118,6 +200,14 @@ class AppController:
         
         return st.session_state.dataframes.get(name)
     
+    @staticmethod
+    def get_revenue_sources(revenue_df: pd.DataFrame) -> List[str]:
+        """Get a copy of the revenue source titles, cached while the Revenue table is unchanged."""
+        if st.session_state.get('revenue_titles_source') is not revenue_df:
+            st.session_state.revenue_titles = tuple(revenue_df['Title'].tolist())
+            st.session_state.revenue_titles_source = revenue_df
+        return list(st.session_state.revenue_titles)
+    
     @staticmethod
     def store_calculation_result(name: str, result: Any):
         """Store a calculation result in the session state."""
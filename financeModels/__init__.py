@@ -35,6 +35,7 @@ from financeModels.file_handler import (
     save_csv,
     load_json,
     save_json,
+    update_json_entry,
     sync_json_to_csv,
     sync_csv_to_json,
     update_csv_from_dataframes,
@@ -67,6 +68,7 @@ __all__ = [
     'save_csv',
     'load_json',
     'save_json',
+    'update_json_entry',
     'sync_json_to_csv',
     'sync_csv_to_json',
     'update_csv_from_dataframes',
@@ -505,166 +505,83 @@ class ComprehensiveProformaCalculator:
         Returns:
             DataFrame with monthly cash flow projection
         """
-        # First, create a set of all year-month combinations from our data
-        all_months = set()
-        
-        # Add months from personnel data
-        if 'monthly' in personnel_results and not personnel_results['monthly'].empty:
-            for _, row in personnel_results['monthly'].iterrows():
-                all_months.add((row['Year'], row['Month']))
-        
-        # Add months from equipment data
-        if 'monthly' in equipment_results and not equipment_results['monthly'].empty:
-            for _, row in equipment_results['monthly'].iterrows():
-                all_months.add((row['Year'], row['Month']))
-        
         # Convert exam annual data to monthly (simplified approach)
         exam_monthly = self._convert_exam_annual_to_monthly(exam_results)
         
-        # Add months from exam data
-        if not exam_monthly.empty:
-            for _, row in exam_monthly.iterrows():
-                all_months.add((row['Year'], row['Month']))
-        
-        # Add months from other expenses/revenue
-        if not other_results['annual'].empty and 'Year' in other_results['annual'].columns and 'Month' in other_results['annual'].columns:
-            for _, row in other_results['annual'].iterrows():
-                # Get year and month from the row if available
-                if 'Year' in row and 'Month' in row:
-                    all_months.add((row['Year'], row['Month']))
-                elif 'Year' in row:
-                    # If only year is available, add all months for that year
-                    for month in range(1, 13):
-                        all_months.add((row['Year'], month))
+        personnel_monthly = personnel_results['monthly'] if 'monthly' in personnel_results else pd.DataFrame()
+        equipment_monthly = equipment_results['monthly'] if 'monthly' in equipment_results else pd.DataFrame()
+        other_annual = other_results['annual']
         
-        # Sort all months chronologically
-        all_months = sorted(all_months)
+        # First, collect all year-month combinations from our data
+        period_frames = [df[['Year', 'Month']] for df in (personnel_monthly, equipment_monthly, exam_monthly) if not df.empty]
+        if not other_annual.empty and 'Year' in other_annual.columns and 'Month' in other_annual.columns:
+            period_frames.append(other_annual[['Year', 'Month']])
         
-        if not all_months:
+        if not period_frames:
             return pd.DataFrame()  # No data available
         
-        # Create monthly cash flow dataframe
-        monthly_data = []
-        
-        for year, month in all_months:
-            row = {
-                'Year': year,
-                'Month': month,
-                'Date': f"{year}-{month:02d}-01"
-            }
-            
-            # Add exam revenue (from our monthly conversion)
-            if not exam_monthly.empty:
-                month_exam_revenue = exam_monthly[
-                    (exam_monthly['Year'] == year) & 
-                    (exam_monthly['Month'] == month)
-                ]['Monthly_Revenue'].sum()
-                row['Exam_Revenue'] = month_exam_revenue
-            else:
-                row['Exam_Revenue'] = 0
-            
-            # Add other revenue (simplified - dividing annual by 12)
-            if not other_results['annual'].empty and 'Year' in other_results['annual'].columns:
-                # Check which column name is used for expense flag
-                expense_col = 'IsExpense' if 'IsExpense' in other_results['annual'].columns else 'Expense'
-                
-                # Filter by year first
-                year_data = other_results['annual'][other_results['annual']['Year'] == year]
-                
-                if not year_data.empty:
-                    # Get revenue items
-                    revenue_items = year_data[year_data[expense_col] == False]
-                    
-                    # If we have month information, filter by month
-                    if 'Month' in year_data.columns:
-                        month_revenue = revenue_items[revenue_items['Month'] == month]['Amount'].sum()
-                        row['Other_Revenue'] = month_revenue
-                    else:
-                        # Otherwise, distribute evenly across months
-                        year_revenue = revenue_items['Amount'].sum()
-                        row['Other_Revenue'] = year_revenue / 12
-                else:
-                    row['Other_Revenue'] = 0
-            else:
-                row['Other_Revenue'] = 0
-            
-            # Calculate total monthly revenue
-            row['Total_Revenue'] = row['Exam_Revenue'] + row['Other_Revenue']
-            
-            # Add personnel expenses
-            if 'monthly' in personnel_results and not personnel_results['monthly'].empty:
-                month_personnel = personnel_results['monthly'][
-                    (personnel_results['monthly']['Year'] == year) & 
-                    (personnel_results['monthly']['Month'] == month)
-                ]['Total_Expense'].sum()
-                row['Personnel_Expenses'] = month_personnel
-            else:
-                row['Personnel_Expenses'] = 0
-            
-            # Add equipment expenses
-            if 'monthly' in equipment_results and not equipment_results['monthly'].empty:
-                month_equipment = equipment_results['monthly'][
-                    (equipment_results['monthly']['Year'] == year) & 
-                    (equipment_results['monthly']['Month'] == month)
-                ]['Monthly_Cost'].sum()
-                row['Equipment_Expenses'] = month_equipment
-            else:
-                row['Equipment_Expenses'] = 0
-            
-            # Add exam direct expenses (from our monthly conversion)
-            if not exam_monthly.empty:
-                month_exam_expenses = exam_monthly[
-                    (exam_monthly['Year'] == year) & 
-                    (exam_monthly['Month'] == month)
-                ]['Monthly_Expenses'].sum()
-                row['Exam_Direct_Expenses'] = month_exam_expenses
-            else:
-                row['Exam_Direct_Expenses'] = 0
-            
-            # Add other expenses (handling monthly data if available)
-            if not other_results['annual'].empty and 'Year' in other_results['annual'].columns:
-                # Check which column name is used for expense flag
-                expense_col = 'IsExpense' if 'IsExpense' in other_results['annual'].columns else 'Expense'
-                
-                # Filter by year first
-                year_data = other_results['annual'][other_results['annual']['Year'] == year]
-                
-                if not year_data.empty:
-                    # Get expense items
-                    expense_items = year_data[year_data[expense_col] == True]
-                    
-                    # If we have month information, filter by month
-                    if 'Month' in year_data.columns:
-                        month_expenses = expense_items[expense_items['Month'] == month]['Amount'].sum()
-                        row['Other_Expenses'] = month_expenses
-                    else:
-                        # Otherwise, distribute evenly across months
-                        year_expenses = expense_items['Amount'].sum()
-                        row['Other_Expenses'] = year_expenses / 12
-                else:
-                    row['Other_Expenses'] = 0
+        # Sort all months chronologically
+        periods = (pd.concat(period_frames, ignore_index=True)
+                   .drop_duplicates()
+                   .sort_values(['Year', 'Month'])
+                   .astype(np.int64))
+        period_index = pd.MultiIndex.from_frame(periods)
+        
+        def period_sums(df: pd.DataFrame, value_col: str) -> np.ndarray:
+            """Sum a column for each month with one groupby, zero for months without rows."""
+            if df.empty:
+                return np.zeros(len(period_index), dtype=np.int64)
+            return df.groupby(['Year', 'Month'])[value_col].sum().reindex(period_index, fill_value=0).to_numpy()
+        
+        # Add exam revenue and direct expenses (from our monthly conversion)
+        exam_revenue = period_sums(exam_monthly, 'Monthly_Revenue')
+        exam_direct_expenses = period_sums(exam_monthly, 'Monthly_Expenses')
+        
+        # Add other revenue and expenses (handling monthly data if available)
+        other_revenue = np.zeros(len(period_index), dtype=np.int64)
+        other_expenses = np.zeros(len(period_index), dtype=np.int64)
+        if not other_annual.empty and 'Year' in other_annual.columns:
+            # Check which column name is used for expense flag
+            expense_col = 'IsExpense' if 'IsExpense' in other_annual.columns else 'Expense'
+            revenue_items = other_annual[other_annual[expense_col] == False]
+            expense_items = other_annual[other_annual[expense_col] == True]
+            
+            if 'Month' in other_annual.columns:
+                other_revenue = period_sums(revenue_items, 'Amount')
+                other_expenses = period_sums(expense_items, 'Amount')
             else:
-                row['Other_Expenses'] = 0
-            
-            # Calculate total monthly expenses
-            row['Total_Expenses'] = (
-                row['Personnel_Expenses'] + 
-                row['Equipment_Expenses'] + 
-                row['Exam_Direct_Expenses'] + 
-                row['Other_Expenses']
-            )
-            
-            # Calculate monthly net income
-            row['Net_Income'] = row['Total_Revenue'] - row['Total_Expenses']
-            
-            monthly_data.append(row)
-        
-        # Convert to DataFrame and ensure date column is datetime
-        monthly_df = pd.DataFrame(monthly_data)
-        if not monthly_df.empty:
-            monthly_df['Date'] = pd.to_datetime(monthly_df['Date'])
-        
-        return monthly_df
+                # Otherwise, distribute evenly across months
+                period_years = period_index.get_level_values('Year')
+                other_revenue = (revenue_items.groupby('Year')['Amount'].sum() / 12).reindex(period_years, fill_value=0).to_numpy()
+                other_expenses = (expense_items.groupby('Year')['Amount'].sum() / 12).reindex(period_years, fill_value=0).to_numpy()
+        
+        # Add personnel and equipment expenses
+        personnel_expenses = period_sums(personnel_monthly, 'Total_Expense')
+        equipment_expenses = period_sums(equipment_monthly, 'Monthly_Cost')
+        
+        # Calculate total monthly revenue, expenses and net income
+        total_revenue = exam_revenue + other_revenue
+        total_expenses = personnel_expenses + equipment_expenses + exam_direct_expenses + other_expenses
+        
+        # Create monthly cash flow dataframe, dated on the first of each month
+        years = periods['Year'].to_numpy()
+        months = periods['Month'].to_numpy()
+        month_starts = (years - 1970).astype('datetime64[Y]') + (months - 1).astype('timedelta64[M]')
+        
+        return pd.DataFrame({
+            'Year': years,
+            'Month': months,
+            'Date': month_starts.astype('datetime64[ns]'),
+            'Exam_Revenue': exam_revenue,
+            'Other_Revenue': other_revenue,
+            'Total_Revenue': total_revenue,
+            'Personnel_Expenses': personnel_expenses,
+            'Equipment_Expenses': equipment_expenses,
+            'Exam_Direct_Expenses': exam_direct_expenses,
+            'Other_Expenses': other_expenses,
+            'Total_Expenses': total_expenses,
+            'Net_Income': total_revenue - total_expenses
+        })
     
     def _convert_exam_annual_to_monthly(self, exam_results: pd.DataFrame) -> pd.DataFrame:
         """
@@ -677,26 +594,21 @@ class ComprehensiveProformaCalculator:
         if exam_results.empty:
             return pd.DataFrame()
         
-        monthly_data = []
+        # For each annual row, create 12 monthly entries
+        n_rows = len(exam_results)
+        monthly_df = pd.DataFrame({
+            'Year': np.repeat(exam_results['Year'].to_numpy(), 12),
+            'Month': np.tile(np.arange(1, 13), n_rows),
+            'Exam': np.repeat(exam_results['Exam'].to_numpy(), 12),
+            'RevenueSource': np.repeat(exam_results['RevenueSource'].to_numpy(), 12)
+        })
         
-        for _, row in exam_results.iterrows():
-            year = row['Year']
-            
-            # For each year, create 12 monthly entries
-            for month in range(1, 13):
-                monthly_row = {
-                    'Year': year,
-                    'Month': month,
-                    'Exam': row['Exam'],
-                    'RevenueSource': row['RevenueSource'],
-                    'Monthly_Volume': row['AnnualVolume'] / 12,  # Simple monthly allocation
-                    'Monthly_Revenue': row['Total_Revenue'] / 12,
-                    'Monthly_Expenses': row['Total_Direct_Expenses'] / 12,
-                    'Monthly_Net': row['Net_Revenue'] / 12
-                }
-                monthly_data.append(monthly_row)
+        # Simple monthly allocation: divide all annual amounts in one array operation
+        annual_cols = ['AnnualVolume', 'Total_Revenue', 'Total_Direct_Expenses', 'Net_Revenue']
+        monthly_cols = ['Monthly_Volume', 'Monthly_Revenue', 'Monthly_Expenses', 'Monthly_Net']
+        monthly_df[monthly_cols] = np.repeat(exam_results[annual_cols].to_numpy(dtype=float) / 12, 12, axis=0)
         
-        return pd.DataFrame(monthly_data)
+        return monthly_df
     
     def _calculate_financial_metrics(self, annual_summary: pd.DataFrame) -> Dict:
         """
@@ -718,9 +630,9 @@ class ComprehensiveProformaCalculator:
             }
         
         # Calculate overall totals
-        total_revenue = annual_summary['Total_Revenue'].sum()
-        total_expenses = annual_summary['Total_Expenses'].sum()
-        total_net_income = annual_summary['Net_Income'].sum()
+        total_revenue, total_expenses, total_net_income = (
+            annual_summary[['Total_Revenue', 'Total_Expenses', 'Net_Income']].sum().to_numpy()
+        )
         
         # Calculate averages
         num_years = len(annual_summary)
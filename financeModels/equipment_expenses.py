@@ -278,17 +278,19 @@ class EquipmentExpenseCalculator:
                 'TotalAnnualExpense': 0
             }
         
-        # Calculate grand totals
+        # Calculate grand totals, reducing all expense columns in one pass
         purchase_costs = self.equipment_data['PurchaseCost'] * self.equipment_data['Quantity']
+        expense_totals = annual_df[['AnnualDepreciation', 'ServiceCost', 'AccreditationCost',
+                                    'InsuranceCost', 'TravelExpense', 'TotalAnnualExpense']].sum()
         
         grand_total = {
             'TotalPurchaseCost': purchase_costs.sum(),
-            'TotalDepreciation': annual_df['AnnualDepreciation'].sum(),
-            'TotalServiceCost': annual_df['ServiceCost'].sum(),
-            'TotalAccreditationCost': annual_df['AccreditationCost'].sum(),
-            'TotalInsuranceCost': annual_df['InsuranceCost'].sum(),
-            'TotalTravelExpense': annual_df['TravelExpense'].sum(),
-            'TotalAnnualExpense': annual_df['TotalAnnualExpense'].sum()
+            'TotalDepreciation': expense_totals['AnnualDepreciation'],
+            'TotalServiceCost': expense_totals['ServiceCost'],
+            'TotalAccreditationCost': expense_totals['AccreditationCost'],
+            'TotalInsuranceCost': expense_totals['InsuranceCost'],
+            'TotalTravelExpense': expense_totals['TravelExpense'],
+            'TotalAnnualExpense': expense_totals['TotalAnnualExpense']
         }
         
         return grand_total
@@ -120,6 +120,44 @@ class ExamRevenueCalculator:
                         df[col] = df[col].astype(str).apply(
                             lambda x: [item.strip() for item in x.split(';')] if ';' in x else x
                         )
+        
+        # Partition revenue sources once so per-source lookups avoid rescanning the table
+        if self.revenue_data.empty or 'Title' not in self.revenue_data.columns:
+            self._revenue_groups = {}
+        else:
+            self._revenue_groups = dict(list(self.revenue_data.groupby('Title', sort=False)))
+        
+        # Maximum reachable volumes do not depend on the date, so they are
+        # computed once per revenue source
+        self._max_volume_cache = {}
+        
+        # Each exam's staff types, duration and equipment are resolved once and
+        # shared by every date and revenue source
+        self._exam_staff_index = None
+        self._exam_lookup_frame = None
+        
+        # Annual volumes are reused across reruns and revenue-source selections,
+        # keyed by everything they depend on besides the loaded data: the year,
+        # revenue source, work days per year, start date (which also sets the
+        # moving days) and population growth rates
+        self._annual_volume_cache = {}
+        
+        # Equipment and staff availability only depend on the date, which is
+        # shared by every revenue source within a year
+        self._available_equipment_cache = {}
+        self._available_staff_cache = {}
+        self._staff_hours_cache = {}
+        
+        # Staff hours only change when the set of employed staff changes, so the
+        # totals are also shared by every date with the same roster
+        self._staff_hours_by_roster = {}
+    
+    def _get_revenue_rows(self, revenue_source: str) -> pd.DataFrame:
+        """Return the revenue data rows for a revenue source (empty if not found)."""
+        revenue_rows = self._revenue_groups.get(revenue_source)
+        if revenue_rows is None:
+            return self.revenue_data.iloc[0:0]
+        return revenue_rows
     
     def load_data(self, 
                  exams_data: pd.DataFrame = None, 
@@ -200,8 +238,20 @@ class ExamRevenueCalculator:
         if not self._check_data_loaded():
             raise ValueError("Data not fully loaded. Call load_data first.")
         
+        return self._max_reachable_volume(revenue_source).copy()
+    
+    def _max_reachable_volume(self, revenue_source: str) -> pd.DataFrame:
+        """Return the maximum reachable volumes for a revenue source, computing them once."""
+        max_volumes = self._max_volume_cache.get(revenue_source)
+        if max_volumes is None:
+            max_volumes = self._calculate_max_reachable_volume(revenue_source)
+            self._max_volume_cache[revenue_source] = max_volumes
+        return max_volumes
+    
+    def _calculate_max_reachable_volume(self, revenue_source: str) -> pd.DataFrame:
+        """Calculate the maximum reachable volumes for a revenue source (uncached)."""
         # Get revenue source data
-        revenue_row = self.revenue_data[self.revenue_data['Title'] == revenue_source]
+        revenue_row = self._get_revenue_rows(revenue_source)
         if len(revenue_row) == 0:
             raise ValueError(f"Revenue source '{revenue_source}' not found")
         
@@ -227,19 +277,25 @@ class ExamRevenueCalculator:
             # Return empty DataFrame with expected columns
             return pd.DataFrame(columns=['RevenueSource', 'Exam', 'MaxReachableVolume', 'AgeFactor', 'GenderFactor', 'ApplicablePct'])
         
-        # Calculate max reachable volume for each exam
-        results = []
-        
-        for _, exam in filtered_exams.iterrows():
+        # Calculate max reachable volume for each exam, collecting each output
+        # column as its own list
+        exams = []
+        max_volumes = []
+        age_factors = []
+        gender_factors = []
+        applicable_pcts = []
+        
+        for title, min_age, max_age, applicable_sex, applicable_pct in zip(
+                filtered_exams['Title'], filtered_exams['MinAge'], filtered_exams['MaxAge'],
+                filtered_exams['ApplicableSex'], filtered_exams['ApplicablePct']):
             try:
                 # Calculate the age factor
-                exam_age_range = exam['MaxAge'] - exam['MinAge']
+                exam_age_range = max_age - min_age
                 revenue_age_range = revenue_source_data['PopulationMaxAge'] - revenue_source_data['PopulationMinAge']
                 age_factor = exam_age_range / revenue_age_range if revenue_age_range > 0 else 0
                 
                 # Calculate the gender factor
                 gender_factor = 0
-                applicable_sex = exam['ApplicableSex']
                 if isinstance(applicable_sex, list):
                     if 'Male' in applicable_sex and 'Female' in applicable_sex:
                         gender_factor = 1.0
@@ -260,29 +316,26 @@ class ExamRevenueCalculator:
                              revenue_source_data['TargetPopulation'] * 
                              revenue_source_data['PctPopulationReached'] * 
                              gender_factor * 
-                             exam['ApplicablePct'])
-                
-                results.append({
-                    'RevenueSource': revenue_source,
-                    'Exam': exam['Title'],
-                    'MaxReachableVolume': max_volume,
-                    'AgeFactor': age_factor,
-                    'GenderFactor': gender_factor,
-                    'ApplicablePct': exam['ApplicablePct']
-                })
+                             applicable_pct)
             except Exception as e:
-                print(f"Error calculating max volume for {exam['Title']}: {e}")
+                print(f"Error calculating max volume for {title}: {e}")
                 # Add a row with zeroes to maintain the exam in the results
-                results.append({
-                    'RevenueSource': revenue_source,
-                    'Exam': exam['Title'],
-                    'MaxReachableVolume': 0,
-                    'AgeFactor': 0,
-                    'GenderFactor': 0,
-                    'ApplicablePct': 0
-                })
-        
-        return pd.DataFrame(results)
+                max_volume = age_factor = gender_factor = applicable_pct = 0
+            
+            exams.append(title)
+            max_volumes.append(max_volume)
+            age_factors.append(age_factor)
+            gender_factors.append(gender_factor)
+            applicable_pcts.append(applicable_pct)
+        
+        return pd.DataFrame({
+            'RevenueSource': revenue_source,
+            'Exam': exams,
+            'MaxReachableVolume': max_volumes,
+            'AgeFactor': age_factors,
+            'GenderFactor': gender_factors,
+            'ApplicablePct': applicable_pcts
+        })
     
     def get_available_equipment(self, date: str) -> pd.DataFrame:
         """
@@ -297,6 +350,9 @@ class ExamRevenueCalculator:
         if not self._check_data_loaded():
             raise ValueError("Data not fully loaded. Call load_data first.")
         
+        if date in self._available_equipment_cache:
+            return self._available_equipment_cache[date]
+        
         # Convert date to datetime
         check_date = pd.to_datetime(date, format='%m/%d/%Y')
         
@@ -317,6 +373,7 @@ class ExamRevenueCalculator:
         # Filter equipment that has been purchased and is ready for use by the check date
         available_equipment = equipment_data[equipment_data['StartDate'] <= check_date]
         
+        self._available_equipment_cache[date] = available_equipment
         return available_equipment
     
     def get_available_staff(self, date: str) -> pd.DataFrame:
@@ -332,6 +389,9 @@ class ExamRevenueCalculator:
         if not self._check_data_loaded():
             raise ValueError("Data not fully loaded. Call load_data first.")
         
+        if date in self._available_staff_cache:
+            return self._available_staff_cache[date]
+        
         # Convert date to datetime
         check_date = pd.to_datetime(date, format='%m/%d/%Y')
         
@@ -341,6 +401,7 @@ class ExamRevenueCalculator:
             ((self.personnel_data['EndDate'] >= check_date) | pd.isna(self.personnel_data['EndDate']))
         ]
         
+        self._available_staff_cache[date] = available_staff
         return available_staff
     
     def calculate_staff_hours_available(self, date: str) -> Dict[str, float]:
@@ -353,23 +414,57 @@ class ExamRevenueCalculator:
         Returns:
             Dictionary mapping staff types to available hours
         """
+        # Callers adjust the hours in place, so hand out a copy of the cached totals
+        if date in self._staff_hours_cache:
+            return dict(self._staff_hours_cache[date])
+        
         available_staff = self.get_available_staff(date)
+        roster = tuple(available_staff.index)
+        
+        staff_hours = self._staff_hours_by_roster.get(roster)
+        if staff_hours is None:
+            # Calculate hours available by staff type
+            staff_hours = {}
+            
+            for staff_type, effort, hours_per_day in zip(available_staff['Type'],
+                                                        available_staff['Effort'],
+                                                        available_staff['HoursPerDay']):
+                # Calculate available hours: Effort * HoursPerDay
+                hours = effort * hours_per_day
+                
+                if staff_type in staff_hours:
+                    staff_hours[staff_type] += hours
+                else:
+                    staff_hours[staff_type] = hours
+            
+            self._staff_hours_by_roster[roster] = staff_hours
         
-        # Calculate hours available by staff type
-        staff_hours = {}
+        self._staff_hours_cache[date] = staff_hours
+        return dict(staff_hours)
+    
+    def _get_exam_staff_index(self) -> Dict[str, Tuple[List[str], float, object]]:
+        """
+        Map each exam title to its required staff types, duration in hours and equipment.
         
-        for _, staff in available_staff.iterrows():
-            staff_type = staff['Type']
-            
-            # Calculate available hours: Effort * HoursPerDay
-            hours = staff['Effort'] * staff['HoursPerDay']
-            
-            if staff_type in staff_hours:
-                staff_hours[staff_type] += hours
+        The first row of a duplicated title wins, and the index is built once per load.
+        """
+        if self._exam_staff_index is None:
+            exams = self.exams_data.drop_duplicates('Title')
+            if 'DurationHours' in exams.columns:
+                durations = exams['DurationHours']
             else:
-                staff_hours[staff_type] = hours
+                durations = exams['Duration'] / 60.0
+            
+            self._exam_staff_index = {}
+            for title, exam_staff, duration_hours, exam_equipment in zip(
+                    exams['Title'], exams['Staff'], durations, exams['Equipment']):
+                if isinstance(exam_staff, list):
+                    staff_types = exam_staff
+                else:
+                    staff_types = [s.strip() for s in str(exam_staff).split(';') if s.strip()]
+                self._exam_staff_index[title] = (staff_types, duration_hours, exam_equipment)
         
-        return staff_hours
+        return self._exam_staff_index
     
     def calculate_exams_per_day(self, date: str, revenue_source: str) -> pd.DataFrame:
         """
@@ -388,10 +483,10 @@ class ExamRevenueCalculator:
         try:
             # Get available equipment
             available_equipment = self.get_available_equipment(date)
-            available_equip_titles = available_equipment['Title'].tolist()
+            available_equip_titles = set(available_equipment['Title'])
             
             # Get revenue source data
-            revenue_row = self.revenue_data[self.revenue_data['Title'] == revenue_source]
+            revenue_row = self._get_revenue_rows(revenue_source)
             if len(revenue_row) == 0:
                 print(f"Warning: Revenue source '{revenue_source}' not found")
                 # Return empty DataFrame with required columns
@@ -425,21 +520,14 @@ class ExamRevenueCalculator:
                                            'LimitingStaff', 'TargetExamsPerDay', 'Duration', 
                                            'StaffHoursRequired', 'LimitedByEquipment', 'LimitingStaffType'])
             
-            # Filter exams that have the necessary equipment
-            exams_with_equipment = []
-            for _, exam in filtered_exams.iterrows():
-                exam_equipment = exam['Equipment']
-                has_equipment = False
-                
-                if isinstance(exam_equipment, list):
-                    if all(equip in available_equip_titles for equip in exam_equipment):
-                        has_equipment = True
-                else:
-                    if exam_equipment in available_equip_titles:
-                        has_equipment = True
-                
-                if has_equipment:
-                    exams_with_equipment.append(exam['Title'])
+            # Filter exams that have the necessary equipment, checking each exam's
+            # equipment against the set of available titles in one pass
+            has_equipment = np.array([
+                all(equip in available_equip_titles for equip in exam_equipment)
+                if isinstance(exam_equipment, list) else exam_equipment in available_equip_titles
+                for exam_equipment in filtered_exams['Equipment']
+            ], dtype=bool)
+            exams_with_equipment = set(filtered_exams['Title'].to_numpy()[has_equipment])
             
             # Re-filter exams to only those with available equipment
             filtered_exams = filtered_exams[filtered_exams['Title'].isin(exams_with_equipment)]
@@ -452,7 +540,7 @@ class ExamRevenueCalculator:
                                            'StaffHoursRequired', 'LimitedByEquipment', 'LimitingStaffType'])
             
             # Calculate the maximum reachable volume for each exam
-            max_volumes_df = self.calculate_max_reachable_volume(revenue_source)
+            max_volumes_df = self._max_reachable_volume(revenue_source)
             
             # Filter max volumes to only exams with available equipment
             max_volumes_df = max_volumes_df[max_volumes_df['Exam'].isin(exams_with_equipment)]
@@ -467,10 +555,6 @@ class ExamRevenueCalculator:
             # Calculate staff hours available
             staff_hours = self.calculate_staff_hours_available(date)
             
-            # Calculate daily exam capacity based on staff availability
-            results = []
-            total_staff_hours_required = 0
-            
             # First calculate proportions based on max reachable volumes
             total_max_volume = max_volumes_df['MaxReachableVolume'].sum()
             
@@ -499,29 +583,28 @@ class ExamRevenueCalculator:
                 for staff_type in staff_hours:
                     staff_hours[staff_type] = max(0, staff_hours[staff_type] - moving_time)
             
-            for _, row in max_volumes_df.iterrows():
+            exam_staff_index = self._get_exam_staff_index()
+            
+            # Resolve each exam's staff capacity per exam, collecting the numeric
+            # inputs so the volume arithmetic below runs as one array pass
+            titles = []
+            max_volumes = []
+            capacities = []
+            durations = []
+            limiting_staff_list = []
+            equipment_list = []
+            failed = []
+            
+            for exam_title, max_volume in zip(max_volumes_df['Exam'].to_numpy(),
+                                              max_volumes_df['MaxReachableVolume'].to_numpy()):
                 try:
-                    exam_title = row['Exam']
-                    exam_rows = filtered_exams[filtered_exams['Title'] == exam_title]
+                    exam_entry = exam_staff_index.get(exam_title)
                     
-                    if exam_rows.empty:
+                    if exam_entry is None:
                         print(f"Warning: Exam {exam_title} not found in filtered_exams")
                         continue
                         
-                    exam_row = exam_rows.iloc[0]
-                    
-                    # Calculate proportion of this exam type
-                    proportion = row['MaxReachableVolume'] / total_max_volume if total_max_volume > 0 else 0
-                    
-                    # Get required staff type for this exam
-                    exam_staff = exam_row['Staff']
-                    if isinstance(exam_staff, list):
-                        staff_types = exam_staff
-                    else:
-                        staff_types = [s.strip() for s in str(exam_staff).split(';') if s.strip()]
-                    
-                    # Get duration in hours
-                    duration_hours = exam_row['DurationHours'] if 'DurationHours' in exam_row else exam_row['Duration'] / 60.0
+                    staff_types, duration_hours, exam_equipment = exam_entry
                     
                     # Calculate capacity for each staff type
                     min_capacity = float('inf')
@@ -545,50 +628,54 @@ class ExamRevenueCalculator:
                         min_capacity = 0
                         limiting_staff = "No staff defined"
                     
-                    # Calculate target exams per day based on proportion
-                    target_exams = proportion * min_capacity
-                    
-                    # Calculate staff hours required
-                    staff_hours_required = target_exams * duration_hours
-                    total_staff_hours_required += staff_hours_required
-                    
-                    # Check if the exam is limited by staff or equipment
-                    limited_by_equipment = exam_title not in exams_with_equipment
-                    
-                    results.append({
-                        'RevenueSource': revenue_source,
-                        'Exam': exam_title,
-                        'Proportion': proportion,
-                        'StaffCapacity': min_capacity,
-                        'LimitingStaff': limiting_staff,
-                        'TargetExamsPerDay': target_exams,
-                        'Duration': duration_hours,
-                        'StaffHoursRequired': staff_hours_required,
-                        'LimitedByEquipment': limited_by_equipment,
-                        'LimitingStaffType': limiting_staff if min_capacity < float('inf') else None,
-                        'Equipment': exam_row['Equipment']
-                    })
+                    titles.append(exam_title)
+                    max_volumes.append(max_volume)
+                    capacities.append(min_capacity)
+                    durations.append(duration_hours)
+                    limiting_staff_list.append(limiting_staff)
+                    equipment_list.append(exam_equipment)
+                    failed.append(False)
                 except Exception as e:
-                    print(f"Error processing exam {row.get('Exam', 'unknown')}: {e}")
+                    print(f"Error processing exam {exam_title}: {e}")
                     # Add a row with default values to maintain the exam in the results
-                    results.append({
-                        'RevenueSource': revenue_source,
-                        'Exam': row.get('Exam', 'unknown'),
-                        'Proportion': 0,
-                        'StaffCapacity': 0,
-                        'LimitingStaff': "Error",
-                        'TargetExamsPerDay': 0,
-                        'Duration': 0,
-                        'StaffHoursRequired': 0,
-                        'LimitedByEquipment': False,
-                        'LimitingStaffType': None,
-                        'Equipment': None
-                    })
-            
-            # Adjust target exams to not exceed staff capacity
-            results_df = pd.DataFrame(results)
-            
-            return results_df
+                    titles.append(exam_title)
+                    max_volumes.append(0)
+                    capacities.append(0)
+                    durations.append(0)
+                    limiting_staff_list.append("Error")
+                    equipment_list.append(None)
+                    failed.append(True)
+            
+            if not titles:
+                return pd.DataFrame()
+            
+            # Calculate the proportion of each exam type, the target exams per day
+            # and the staff hours they require
+            capacities = np.asarray(capacities, dtype=float)
+            if total_max_volume > 0:
+                proportions = np.asarray(max_volumes, dtype=float) / total_max_volume
+            else:
+                proportions = np.zeros(len(titles))
+            target_exams = proportions * capacities
+            staff_hours_required = target_exams * np.asarray(durations, dtype=float)
+            
+            return pd.DataFrame({
+                'RevenueSource': revenue_source,
+                'Exam': titles,
+                'Proportion': proportions,
+                'StaffCapacity': capacities,
+                'LimitingStaff': limiting_staff_list,
+                'TargetExamsPerDay': target_exams,
+                'Duration': np.asarray(durations, dtype=float),
+                'StaffHoursRequired': staff_hours_required,
+                # Exams without their equipment were filtered out above
+                'LimitedByEquipment': [title not in exams_with_equipment for title in titles],
+                'LimitingStaffType': [
+                    None if error or capacity == float('inf') else staff
+                    for staff, capacity, error in zip(limiting_staff_list, capacities, failed)
+                ],
+                'Equipment': equipment_list
+            })
         except Exception as e:
             print(f"Error in calculate_exams_per_day for {revenue_source}: {e}")
             # Return empty DataFrame with required columns
@@ -611,11 +698,47 @@ class ExamRevenueCalculator:
         if not self._check_data_loaded():
             raise ValueError("Data not fully loaded. Call load_data first.")
         
+        start_year = int(pd.to_datetime(self.start_date, format='%m/%d/%Y').year)
+        return self._annual_exam_volume(year, revenue_source, work_days_per_year, start_year).copy()
+    
+    def _exam_lookup(self) -> pd.DataFrame:
+        """Return the exam data with one row per title (the first), indexed by title."""
+        if self._exam_lookup_frame is None:
+            self._exam_lookup_frame = self.exams_data.drop_duplicates('Title').set_index('Title', drop=False)
+        return self._exam_lookup_frame
+    
+    def _annual_exam_volume(self, year: int, revenue_source: str, work_days_per_year: int,
+                            start_year: int) -> pd.DataFrame:
+        """Return the annual exam volume for one year and revenue source, computing it once."""
+        key = (year, revenue_source, work_days_per_year, self.start_date,
+               tuple(self.population_growth_rates))
+        annual_volume = self._annual_volume_cache.get(key)
+        if annual_volume is None:
+            annual_volume = self._calculate_annual_exam_volume(year, revenue_source, work_days_per_year,
+                                                               start_year, self._exam_lookup())
+            self._annual_volume_cache[key] = annual_volume
+        return annual_volume
+    
+    def _calculate_annual_exam_volume(self, year: int, revenue_source: str, work_days_per_year: int,
+                                      start_year: int, exam_lookup: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculate the annual exam volume for one year and revenue source (uncached).
+        
+        Args:
+            year: The year to calculate for
+            revenue_source: Name of the revenue source
+            work_days_per_year: Number of working days per year
+            start_year: Year of the calculator start date
+            exam_lookup: Exam data with one row per exam title, indexed by title
+            
+        Returns:
+            DataFrame with annual exam volumes, revenue, and expenses
+        """
         # Use mid-year date to check availability
         check_date = f"07/01/{year}"
         
         # Get revenue source data
-        revenue_row = self.revenue_data[self.revenue_data['Title'] == revenue_source]
+        revenue_row = self._get_revenue_rows(revenue_source)
         if len(revenue_row) == 0:
             print(f"Warning: Revenue source '{revenue_source}' not found")
             # Return empty DataFrame with expected columns
@@ -624,13 +747,12 @@ class ExamRevenueCalculator:
         revenue_source_data = revenue_row.iloc[0].copy()
         
         # Calculate year index based on start date, to determine which growth rate to apply
-        start_year = int(pd.to_datetime(self.start_date, format='%m/%d/%Y').year)
         year_index = year - start_year
         
         # Apply growth rate to PctPopulationReached if within the growth rates list
         if year_index >= 0 and year_index < len(self.population_growth_rates):
             # Get the original value from the data
-            original_pct = self.revenue_data.loc[self.revenue_data['Title'] == revenue_source, 'PctPopulationReached'].values[0]
+            original_pct = revenue_row['PctPopulationReached'].values[0]
             
             # Calculate cumulative growth from the original value
             # Example: If original is 0.2 (20%) and growth rates are [0.0, 0.05, 0.05],
@@ -661,85 +783,64 @@ class ExamRevenueCalculator:
             # Calculate annual volume with the full model percentage
             full_model_pct = revenue_source_data['PctFullModel']
             
-            results = []
-            for _, row in daily_exams_df.iterrows():
-                try:
-                    exam_title = row['Exam']
-                    
-                    # Get exam data
-                    exam_rows = self.exams_data[self.exams_data['Title'] == exam_title]
-                    if exam_rows.empty:
-                        print(f"Warning: Exam {exam_title} not found in exams data")
-                        continue
-                    
-                    exam_row = exam_rows.iloc[0]
-                    
-                    # Calculate annual volume
-                    annual_volume = work_days_per_year * full_model_pct * row['TargetExamsPerDay']
-                    
-                    # Calculate revenue based on exam price
-                    exam_price = exam_row.get('Price', 0)
-                    if exam_price == 0 and 'Rate' in exam_row:
-                        exam_price = exam_row['Rate']
-                    # Add support for CMSTechRate and CMSProRate
-                    if exam_price == 0:
-                        # Get CMS rates if available
-                        cms_tech_rate = exam_row.get('CMSTechRate', 0)
-                        cms_pro_rate = exam_row.get('CMSProRate', 0)
-                        # Use the revenue source's PctCMS to calculate CMS portion
-                        cms_pct = revenue_source_data.get('PctCMS', 0)
-                        # Use the NonCMSMultiplier for non-CMS portion
-                        non_cms_multiplier = revenue_source_data.get('NonCMSMultiplier', 1.0)
-                        # Calculate price based on CMS and non-CMS components
-                        cms_price = (cms_tech_rate + cms_pro_rate) * cms_pct
-                        non_cms_price = (cms_tech_rate + cms_pro_rate) * non_cms_multiplier * (1 - cms_pct)
-                        exam_price = cms_price + non_cms_price
-                        # Add flat patient fee if applicable
-                        flat_fee = revenue_source_data.get('FlatPatientFee', 0)
-                        if flat_fee > 0:
-                            exam_price += flat_fee
-                    annual_revenue = annual_volume * exam_price
-                    
-                    # Calculate direct expenses based on direct cost
-                    direct_cost = exam_row.get('DirectCost', 0)
-                    if direct_cost == 0 and 'VariableCost' in exam_row:
-                        direct_cost = exam_row['VariableCost']
-                    # Add support for SupplyCost, OrderCost, and InterpCost
-                    if direct_cost == 0:
-                        supply_cost = exam_row.get('SupplyCost', 0)
-                        order_cost = exam_row.get('OrderCost', 0)
-                        interp_cost = exam_row.get('InterpCost', 0)
-                        direct_cost = supply_cost + order_cost + interp_cost
-                    annual_direct_expenses = annual_volume * direct_cost
-                    
-                    # Calculate net revenue
-                    net_revenue = annual_revenue - annual_direct_expenses
-                    
-                    # Only include the essential columns for volume analysis
-                    results.append({
-                        'Year': year,
-                        'RevenueSource': revenue_source,
-                        'Exam': exam_title,
-                        'AnnualVolume': annual_volume,
-                        'Total_Revenue': annual_revenue,
-                        'Total_Direct_Expenses': annual_direct_expenses,
-                        'Net_Revenue': net_revenue
-                    })
-                    
-                except Exception as e:
-                    print(f"Error processing exam {row.get('Exam', 'unknown')}: {e}")
-                    # Add a minimal record to maintain the exam in the results
-                    results.append({
-                        'Year': year,
-                        'RevenueSource': revenue_source,
-                        'Exam': row.get('Exam', 'unknown'),
-                        'AnnualVolume': 0,
-                        'Total_Revenue': 0,
-                        'Total_Direct_Expenses': 0,
-                        'Net_Revenue': 0
-                    })
-            
-            return pd.DataFrame(results)
+            # Attach the exam data (first row per title) to each daily exam row. The
+            # lookup is indexed by title, so its hash table is built once per batch
+            # rather than re-hashing the exam names in a merge for every call
+            daily_titles = daily_exams_df['Exam'].to_numpy()
+            positions = exam_lookup.index.get_indexer(daily_titles)
+            found = positions >= 0
+            for exam_title in daily_titles[~found]:
+                print(f"Warning: Exam {exam_title} not found in exams data")
+            merged = exam_lookup.iloc[positions[found]].reset_index(drop=True)
+            merged['Exam'] = daily_titles[found]
+            merged['TargetExamsPerDay'] = daily_exams_df['TargetExamsPerDay'].to_numpy()[found]
+            
+            def exam_column(name: str) -> np.ndarray:
+                """Return an exam cost/price column as floats, zero if the column is absent."""
+                if name in merged.columns:
+                    return merged[name].to_numpy(dtype=float)
+                return np.zeros(len(merged))
+            
+            # Calculate annual volume
+            annual_volume = work_days_per_year * full_model_pct * merged['TargetExamsPerDay'].to_numpy(dtype=float)
+            
+            # Calculate revenue based on exam price, falling back to Rate and then
+            # to the CMS tech/professional rates for exams without a price
+            exam_price = exam_column('Price')
+            if 'Rate' in merged.columns:
+                exam_price = np.where(exam_price == 0, exam_column('Rate'), exam_price)
+            # Use the revenue source's PctCMS for the CMS portion and the
+            # NonCMSMultiplier for the non-CMS portion
+            cms_pct = revenue_source_data.get('PctCMS', 0)
+            non_cms_multiplier = revenue_source_data.get('NonCMSMultiplier', 1.0)
+            cms_rates = exam_column('CMSTechRate') + exam_column('CMSProRate')
+            cms_based_price = cms_rates * cms_pct + cms_rates * non_cms_multiplier * (1 - cms_pct)
+            # Add flat patient fee if applicable
+            flat_fee = revenue_source_data.get('FlatPatientFee', 0)
+            if flat_fee > 0:
+                cms_based_price = cms_based_price + flat_fee
+            exam_price = np.where(exam_price == 0, cms_based_price, exam_price)
+            annual_revenue = annual_volume * exam_price
+            
+            # Calculate direct expenses based on direct cost, falling back to
+            # VariableCost and then to the supply, order and interpretation costs
+            direct_cost = exam_column('DirectCost')
+            if 'VariableCost' in merged.columns:
+                direct_cost = np.where(direct_cost == 0, exam_column('VariableCost'), direct_cost)
+            component_cost = exam_column('SupplyCost') + exam_column('OrderCost') + exam_column('InterpCost')
+            direct_cost = np.where(direct_cost == 0, component_cost, direct_cost)
+            annual_direct_expenses = annual_volume * direct_cost
+            
+            # Only include the essential columns for volume analysis
+            return pd.DataFrame({
+                'Year': year,
+                'RevenueSource': revenue_source,
+                'Exam': merged['Exam'].to_numpy(),
+                'AnnualVolume': annual_volume,
+                'Total_Revenue': annual_revenue,
+                'Total_Direct_Expenses': annual_direct_expenses,
+                'Net_Revenue': annual_revenue - annual_direct_expenses
+            })
         
         except Exception as e:
             print(f"Error calculating annual exam volume for {revenue_source} in {year}: {e}")
@@ -759,6 +860,23 @@ class ExamRevenueCalculator:
         Returns:
             DataFrame with annual exam volumes, revenue, and expenses for all years and revenue sources
         """
+        return self.calculate_annual_exam_volumes(range(start_year, end_year + 1), revenue_sources, work_days_per_year)
+    
+    def calculate_annual_exam_volumes(self, years: List[int], revenue_sources: List[str] = None, work_days_per_year: int = 250) -> pd.DataFrame:
+        """
+        Calculate annual exam volumes for every combination of years and revenue sources.
+        
+        The start year is resolved once for the batch, and each year and source is
+        only calculated the first time it is requested.
+        
+        Args:
+            years: Years to calculate for
+            revenue_sources: List of revenue sources to analyze (default: all revenue sources)
+            work_days_per_year: Number of working days per year
+            
+        Returns:
+            Long-format DataFrame with one row per year, revenue source and exam
+        """
         if not self._check_data_loaded():
             raise ValueError("Data not fully loaded. Call load_data first.")
         
@@ -766,12 +884,14 @@ class ExamRevenueCalculator:
         if revenue_sources is None:
             revenue_sources = self.revenue_data['Title'].tolist()
         
+        start_year = int(pd.to_datetime(self.start_date, format='%m/%d/%Y').year)
+        
         # Collect results for all years and revenue sources
         all_results = []
         
-        for year in range(start_year, end_year + 1):
+        for year in years:
             for revenue_source in revenue_sources:
-                annual_results = self.calculate_annual_exam_volume(year, revenue_source, work_days_per_year)
+                annual_results = self._annual_exam_volume(year, revenue_source, work_days_per_year, start_year)
                 if not annual_results.empty:
                     all_results.append(annual_results)
         
@@ -8,11 +8,44 @@ This module provides functions to:
 """
 
 import pandas as pd
+import numpy as np
 import json
 import os
+import re
 from typing import Dict, List, Optional, Union
 from datetime import datetime, date
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library json module
+    orjson = None
+
+# Directory (next to the CSV files) holding parsed Parquet copies of the CSVs
+CACHE_DIR = ".cache_parquet"
+
+# Matches numbers written with underscore separators, e.g. "1_000_000.50"
+_UNDERSCORE_NUM_RE = re.compile(r'^\d+(_\d+)*(\.\d+)?$')
+
+def write_atomically(write, filepath: str):
+    """
+    Write a file through a temporary sibling file and swap it into place.
+    
+    Readers never see a half-written file, and a failed write leaves the
+    previous version untouched.
+    
+    Args:
+        write: Callable that writes the content to the path it is given
+        filepath: Final path of the file
+    """
+    tmp_path = filepath + '.tmp'
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
 def process_value_for_display(value):
     """Format values for display in the data editor."""
     if isinstance(value, str) and ';' in value:
@@ -34,16 +67,218 @@ def process_value_for_save(value):
             return str(value)
     return value
 
+def process_column_for_display(values: pd.Series) -> pd.Series:
+    """
+    Vectorized process_value_for_display for a whole column.
+    
+    Args:
+        values: Column to process
+        
+    Returns:
+        Column with semicolon-separated values cleaned up
+    """
+    try:
+        has_separator = values.str.contains(';', regex=False, na=False)
+    except AttributeError:
+        # Column holds no string values
+        return values
+    
+    if not has_separator.any():
+        return values
+    
+    # Trim separators and whitespace at both ends, then normalize the rest to "; "
+    cleaned = (
+        values[has_separator]
+        .str.replace(r'^[\s;]+|[\s;]+$', '', regex=True)
+        .str.replace(r'\s*;[\s;]*', '; ', regex=True)
+    )
+    return values.mask(has_separator, cleaned)
+
+def process_column_for_save(values: pd.Series) -> pd.Series:
+    """
+    Vectorized process_value_for_save for a whole column.
+    
+    Only columns holding lists or dates need converting; the type is taken from
+    the first non-null value so scalar columns are returned untouched.
+    
+    Args:
+        values: Column to process
+        
+    Returns:
+        Column ready to be written to CSV or JSON
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        # Missing dates are written as 'NaT', matching process_value_for_save
+        return values.dt.strftime('%m/%d/%Y').fillna('NaT')
+    
+    if values.dtype != 'object':
+        return values
+    
+    non_null = values.dropna()
+    if non_null.empty:
+        return values
+    
+    if isinstance(non_null.iloc[0], (list, tuple, datetime)):
+        return values.map(process_value_for_save)
+    
+    return values
+
+def prepare_dataframe_for_save(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Apply process_column_for_save to every column without copying the DataFrame.
+    
+    Columns that need no conversion are shared with the input; if none change,
+    the input DataFrame itself is returned.
+    
+    Args:
+        df: DataFrame to prepare
+        
+    Returns:
+        DataFrame ready to be written to CSV or JSON
+    """
+    changed = {}
+    for col in df.columns:
+        values = df[col]
+        processed = process_column_for_save(values)
+        if processed is not values:
+            changed[col] = processed
+    
+    if not changed:
+        return df
+    return df.assign(**changed)
+
 def convert_underscore_numbers(value):
     """Convert string numbers with underscores to integers or floats."""
-    import re
     if isinstance(value, str):
         # If it's a string that looks like a number with underscores
-        if re.match(r'^\d+(_\d+)*(\.\d+)?$', value):
+        if _UNDERSCORE_NUM_RE.match(value):
             # Remove underscores and convert to number
             return float(value.replace('_', ''))
     return value
 
+def convert_underscore_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert underscore-separated number strings to floats, one column at a time.
+    
+    Vectorized equivalent of applying convert_underscore_numbers to every cell.
+    
+    Args:
+        df: DataFrame to process in place
+        
+    Returns:
+        The processed DataFrame
+    """
+    for col in df.select_dtypes(include='object').columns:
+        values = df[col]
+        try:
+            mask = values.str.match(_UNDERSCORE_NUM_RE, na=False)
+        except AttributeError:
+            # Column holds no string values
+            continue
+        
+        if not mask.any():
+            continue
+        
+        converted = pd.to_numeric(
+            values[mask].str.replace('_', '', regex=False)
+        ).astype(float)
+        
+        if (mask | values.isna()).all():
+            # Every value is numeric, so the column becomes numeric too
+            df[col] = converted.reindex(values.index)
+        else:
+            df[col] = values.mask(mask, converted)
+    
+    return df
+
+def normalize_missing_text(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Use NaN for missing values in text columns, matching the default C parser.
+    
+    The pyarrow CSV reader and read_parquet leave missing text cells as None.
+    
+    Args:
+        df: DataFrame to process in place
+        
+    Returns:
+        The processed DataFrame
+    """
+    object_columns = df.select_dtypes(include='object').columns
+    df[object_columns] = df[object_columns].fillna(np.nan)
+    return df
+
+def read_csv_fast(filepath: str) -> pd.DataFrame:
+    """
+    Parse a CSV file with the multithreaded pyarrow reader when it is available.
+    
+    The pyarrow engine has no skipinitialspace option, so files with spaces
+    after the commas fall back to the default C parser.
+    
+    Args:
+        filepath: Path to the CSV file
+        
+    Returns:
+        DataFrame containing the raw CSV data
+    """
+    try:
+        df = pd.read_csv(filepath, engine='pyarrow')
+    except ImportError:
+        return pd.read_csv(filepath, skipinitialspace=True)
+    
+    header_padded = any(str(col).startswith(' ') for col in df.columns)
+    values_padded = any(
+        df[col].astype(str).str.startswith(' ').any()
+        for col in df.select_dtypes(include='object').columns
+    )
+    if header_padded or values_padded:
+        return pd.read_csv(filepath, skipinitialspace=True)
+    
+    return normalize_missing_text(df)
+
+def get_parquet_cache_path(filepath: str) -> str:
+    """Return the path of the Parquet copy kept for a CSV file."""
+    directory, filename = os.path.split(filepath)
+    return os.path.join(directory, CACHE_DIR, os.path.splitext(filename)[0] + '.parquet')
+
+def read_parquet_cache(filepath: str) -> Optional[pd.DataFrame]:
+    """
+    Read the Parquet copy of a CSV file if it is at least as new as the CSV.
+    
+    Args:
+        filepath: Path to the CSV file
+        
+    Returns:
+        The cached DataFrame, or None if there is no usable copy
+    """
+    parquet_path = get_parquet_cache_path(filepath)
+    try:
+        if os.path.getmtime(parquet_path) < os.path.getmtime(filepath):
+            return None
+        return normalize_missing_text(pd.read_parquet(parquet_path))
+    except Exception:
+        return None
+
+def write_parquet_cache(df: pd.DataFrame, filepath: str) -> bool:
+    """
+    Write the Parquet copy of a processed CSV file.
+    
+    Args:
+        df: Processed DataFrame loaded from the CSV file
+        filepath: Path to the CSV file
+        
+    Returns:
+        True if the copy was written, False otherwise
+    """
+    parquet_path = get_parquet_cache_path(filepath)
+    try:
+        os.makedirs(os.path.dirname(parquet_path), exist_ok=True)
+        write_atomically(lambda path: df.to_parquet(path, index=False), parquet_path)
+        return True
+    except Exception as e:
+        # Mixed-type columns or a missing Parquet engine; keep using the CSV
+        print(f"Could not write Parquet cache for {filepath}: {str(e)}")
+        return False
+
 def load_csv(filepath: str) -> pd.DataFrame:
     """
     Load a CSV file into a DataFrame with appropriate processing.
@@ -55,18 +290,23 @@ def load_csv(filepath: str) -> pd.DataFrame:
         DataFrame containing the CSV data
     """
     try:
+        # Reuse the parsed Parquet copy while the CSV is unchanged
+        df = read_parquet_cache(filepath)
+        if df is not None:
+            return df
+        
         # Handle the specific format of these CSVs with spaces after commas
-        df = pd.read_csv(filepath, skipinitialspace=True)
+        df = read_csv_fast(filepath)
         
         # Process numeric values with underscores
-        for col in df.columns:
-            df[col] = df[col].apply(convert_underscore_numbers)
+        convert_underscore_columns(df)
             
         # Process semicolon-separated values
         for col in df.columns:
             if df[col].dtype == 'object':  # Only process string columns
-                df[col] = df[col].apply(process_value_for_display)
+                df[col] = process_column_for_display(df[col])
         
+        write_parquet_cache(df, filepath)
         return df
     except Exception as e:
         raise IOError(f"Error loading {filepath}: {e}")
@@ -84,11 +324,9 @@ def save_csv(df: pd.DataFrame, filepath: str) -> bool:
     """
     try:
         # Process values for saving
-        save_df = df.copy()
-        for col in save_df.columns:
-            save_df[col] = save_df[col].apply(process_value_for_save)
+        save_df = prepare_dataframe_for_save(df)
         
-        save_df.to_csv(filepath, index=False)
+        write_atomically(lambda path: save_df.to_csv(path, index=False), filepath)
         return True
     except Exception as e:
         raise IOError(f"Error saving {filepath}: {e}")
@@ -105,8 +343,7 @@ def load_json(filepath: str) -> Dict[str, pd.DataFrame]:
         Dictionary mapping names to DataFrames
     """
     try:
-        with open(filepath, 'r') as f:
-            json_dict = json.load(f)
+        json_dict = read_json_file(filepath)
         
         data_dict = {}
         for key, records in json_dict.items():
@@ -123,11 +360,14 @@ def load_json(filepath: str) -> Dict[str, pd.DataFrame]:
                 # Create DataFrame from records
                 df = pd.DataFrame.from_records(records)
                 
+                # orjson writes NaN as null, which reads back as None
+                normalize_missing_text(df)
+                
                 # Process values after import
+                convert_underscore_columns(df)
                 for col in df.columns:
-                    df[col] = df[col].apply(convert_underscore_numbers)
                     if df[col].dtype == 'object':
-                        df[col] = df[col].apply(process_value_for_display)
+                        df[col] = process_column_for_display(df[col])
                 
                 data_dict[key] = df
             except Exception as e:
@@ -149,6 +389,86 @@ def load_json(filepath: str) -> Dict[str, pd.DataFrame]:
         print(f"Error importing from JSON: {str(e)}")
         return {}
 
+class DateTimeEncoder(json.JSONEncoder):
+    """JSON encoder that writes datetime objects as 'MM/DD/YYYY' strings."""
+    def default(self, obj):
+        if isinstance(obj, (pd.Timestamp, pd.DatetimeIndex, datetime, date)):
+            return obj.strftime('%m/%d/%Y')
+        return json.JSONEncoder.default(self, obj)
+
+def _json_default(obj):
+    """Serialize datetime objects for orjson the same way DateTimeEncoder does."""
+    if isinstance(obj, (pd.Timestamp, pd.DatetimeIndex, datetime, date)):
+        return obj.strftime('%m/%d/%Y')
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def read_json_file(filepath: str):
+    """
+    Read and parse a JSON file, using orjson when it is installed.
+    
+    Args:
+        filepath: Path to the JSON file
+        
+    Returns:
+        The parsed JSON content
+    """
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            content = f.read()
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Files written by the json module may contain NaN, which orjson rejects
+            return json.loads(content)
+    
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+def write_json_file(json_dict: Dict, filepath: str):
+    """
+    Write a dictionary to a JSON file, using orjson when it is installed.
+    
+    Args:
+        json_dict: Dictionary to write
+        filepath: Path to the JSON file
+    """
+    if orjson is not None:
+        content = orjson.dumps(
+            json_dict,
+            default=_json_default,
+            option=(orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY |
+                    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+        )
+        with open(filepath, 'wb') as f:
+            f.write(content)
+        return
+    
+    with open(filepath, 'w') as f:
+        json.dump(json_dict, f, indent=2, cls=DateTimeEncoder)
+
+def dataframe_to_json_records(key: str, df: pd.DataFrame) -> List[Dict]:
+    """
+    Convert a DataFrame to the list of records stored in the JSON file.
+    
+    Args:
+        key: Name of the dataset, used in error messages
+        df: DataFrame (or DataFrame-like object) to convert
+        
+    Returns:
+        List of row dictionaries
+    """
+    # Ensure we're working with a pandas DataFrame
+    if not isinstance(df, pd.DataFrame):
+        try:
+            df = pd.DataFrame(df)
+        except Exception as e:
+            raise ValueError(f"Could not convert '{key}' to DataFrame: {str(e)}")
+    
+    # Process values for JSON export
+    export_df = prepare_dataframe_for_save(df)
+    
+    return export_df.to_dict(orient='records')
+
 def save_json(data_dict: Dict[str, pd.DataFrame], filepath: str) -> bool:
     """
     Save a dictionary of DataFrames to a JSON file.
@@ -161,37 +481,47 @@ def save_json(data_dict: Dict[str, pd.DataFrame], filepath: str) -> bool:
         True if successful, raises exception otherwise
     """
     try:
-        # Define a custom JSON encoder to handle datetime objects
-        class DateTimeEncoder(json.JSONEncoder):
-            def default(self, obj):
-                if isinstance(obj, (pd.Timestamp, pd.DatetimeIndex, datetime, date)):
-                    return obj.strftime('%m/%d/%Y')
-                return json.JSONEncoder.default(self, obj)
-        
         # Convert DataFrames to serializable format
         json_dict = {}
         for key, df in data_dict.items():
-            # Ensure we're working with a pandas DataFrame
-            if not isinstance(df, pd.DataFrame):
-                try:
-                    df = pd.DataFrame(df)
-                except Exception as e:
-                    raise ValueError(f"Could not convert '{key}' to DataFrame: {str(e)}")
-            
-            # Process values for JSON export
-            export_df = df.copy()
-            for col in export_df.columns:
-                export_df[col] = export_df[col].apply(process_value_for_save)
-            
-            json_dict[key] = export_df.to_dict(orient='records')
+            json_dict[key] = dataframe_to_json_records(key, df)
         
-        with open(filepath, 'w') as f:
-            json.dump(json_dict, f, indent=2, cls=DateTimeEncoder)
+        write_json_file(json_dict, filepath)
         
         return True
     except Exception as e:
         raise IOError(f"Error exporting to JSON: {str(e)}")
 
+def update_json_entry(key: str, df: pd.DataFrame, filepath: str) -> bool:
+    """
+    Replace a single dataset in an existing JSON file.
+    
+    Only the changed DataFrame is converted; the other datasets are carried
+    over from the file as already-serialized records.
+    
+    Args:
+        key: Name of the dataset to replace
+        df: DataFrame holding the new data
+        filepath: Path to the JSON file
+        
+    Returns:
+        True if successful, raises exception otherwise (including when the
+        file does not exist or is not a valid dataset file)
+    """
+    try:
+        json_dict = read_json_file(filepath)
+        
+        if not isinstance(json_dict, dict):
+            raise ValueError("JSON file does not contain a dataset mapping")
+        
+        json_dict[key] = dataframe_to_json_records(key, df)
+        
+        write_json_file(json_dict, filepath)
+        
+        return True
+    except Exception as e:
+        raise IOError(f"Error updating '{key}' in JSON: {str(e)}")
+
 def sync_json_to_csv(json_filepath: str, csv_mapping: Dict[str, str]) -> Dict[str, pd.DataFrame]:
     """
     Load data from a JSON file and update corresponding CSV files.
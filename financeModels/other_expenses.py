@@ -80,36 +80,33 @@ class OtherExpensesCalculator:
         start_dt = pd.to_datetime(start_date, format='%m/%d/%Y')
         end_dt = pd.to_datetime(end_date, format='%m/%d/%Y')
         
-        # Create a list to store annual items records
-        annual_items = []
+        # Keep items not applied before the start or after the end date
+        applied_dates = self.other_data['AppliedDate']
+        in_range = ~((applied_dates > end_dt) | (applied_dates < start_dt))
+        items = self.other_data[in_range]
         
-        # Process each expense/revenue item
-        for _, item in self.other_data.iterrows():
-            applied_date = item['AppliedDate']
-            
-            # Skip if item is applied after the specified end date
-            if applied_date > end_dt:
-                continue
-            
-            # Skip if item is applied before the specified start date
-            if applied_date < start_dt:
-                continue
-            
-            # Add record to the list
-            record = {
-                'Title': item['Title'],
-                'Vendor': item['Vendor'],
-                'Year': applied_date.year,
-                'Month': applied_date.month,
-                'Amount': item['Amount'],
-                'Description': item['Description'],
-                'IsExpense': item['Expense'],
-                'Category': 'Expense' if item['Expense'] else 'Revenue'
-            }
-            annual_items.append(record)
-        
-        # Convert to DataFrame
-        result = pd.DataFrame(annual_items)
+        if items.empty:
+            return pd.DataFrame()
+        
+        applied_dates = items['AppliedDate']
+        years = applied_dates.dt.year
+        months = applied_dates.dt.month
+        if not applied_dates.isna().any():
+            # Small integer widths keep the downstream year/month groupbys compact
+            years = years.astype('int16')
+            months = months.astype('int8')
+        
+        # Build all records at once from the selected columns
+        result = pd.DataFrame({
+            'Title': items['Title'].to_numpy(),
+            'Vendor': items['Vendor'].to_numpy(),
+            'Year': years.to_numpy(),
+            'Month': months.to_numpy(),
+            'Amount': items['Amount'].to_numpy(),
+            'Description': items['Description'].to_numpy(),
+            'IsExpense': items['Expense'].to_numpy(),
+            'Category': np.where(items['Expense'].to_numpy(), 'Expense', 'Revenue').astype(object)
+        })
         return result
     
     def calculate_by_category(self, start_date: str, end_date: str) -> pd.DataFrame:
@@ -136,6 +133,22 @@ class OtherExpensesCalculator:
         
         return category_df
     
+    def split_by_category(self, category_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        Partition category totals into expenses and revenue.
+        
+        Args:
+            category_df: DataFrame returned by calculate_by_category
+            
+        Returns:
+            Dictionary mapping 'Expense' and 'Revenue' to their rows, sorted by amount descending
+        """
+        sorted_df = category_df.sort_values('Amount', ascending=False)
+        return {
+            category: sorted_df[sorted_df['Category'] == category]
+            for category in ('Expense', 'Revenue')
+        }
+    
     def calculate_expense_total(self, start_date: str, end_date: str) -> float:
         """
         Calculate grand total of all expenses.
@@ -236,9 +249,12 @@ def calculate_other_expenses(other_data: pd.DataFrame, start_date: str, end_date
     """
     calculator = OtherExpensesCalculator(other_data=other_data)
     
+    by_category = calculator.calculate_by_category(start_date, end_date)
+    
     results = {
         'annual_items': calculator.calculate_annual_items(start_date, end_date),
-        'by_category': calculator.calculate_by_category(start_date, end_date),
+        'by_category': by_category,
+        'by_category_sorted': calculator.split_by_category(by_category),
         'summary': calculator.calculate_summary(start_date, end_date)
     }
     
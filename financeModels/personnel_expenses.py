@@ -210,12 +210,8 @@ class PersonnelExpenseCalculator:
         # Get monthly expenses first
         monthly_df = self.calculate_monthly_expense(start_date, end_date)
         
-        # Calculate grand totals
-        grand_total = {
-            'Base_Expense': monthly_df['Base_Expense'].sum(),
-            'Fringe_Amount': monthly_df['Fringe_Amount'].sum(),
-            'Total_Expense': monthly_df['Total_Expense'].sum()
-        }
+        # Calculate grand totals, reducing all expense columns in one pass
+        grand_total = monthly_df[['Base_Expense', 'Fringe_Amount', 'Total_Expense']].sum().to_dict()
         
         return grand_total
     
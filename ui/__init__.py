@@ -5,14 +5,19 @@ This package contains modules for each tab in the Streamlit application,
 separating the UI rendering logic from the core application logic.
 """
 
-# These will be uncommented as each module is created
-from ui.revenue_tab import render_revenue_tab
-from ui.equipment_tab import render_equipment_tab
-from ui.personnel_tab import render_personnel_tab
-from ui.exams_tab import render_exams_tab
-from ui.other_expenses_tab import render_other_expenses_tab
-from ui.plots_tab import render_plots_tab
-from ui.comprehensive_tab import render_comprehensive_tab
+import importlib
+
+# Tab renderers are imported from their modules on first access, so opening
+# one tab does not load the plotting and model code of every other tab
+_RENDERER_MODULES = {
+    'render_revenue_tab': 'ui.revenue_tab',
+    'render_equipment_tab': 'ui.equipment_tab',
+    'render_personnel_tab': 'ui.personnel_tab',
+    'render_exams_tab': 'ui.exams_tab',
+    'render_other_expenses_tab': 'ui.other_expenses_tab',
+    'render_plots_tab': 'ui.plots_tab',
+    'render_comprehensive_tab': 'ui.comprehensive_tab',
+}
 
 __all__ = [
     'render_revenue_tab',
@@ -22,4 +27,10 @@ __all__ = [
     'render_other_expenses_tab',
     'render_plots_tab',
     'render_comprehensive_tab',
-] 
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """Import a tab renderer the first time it is requested."""
+    if name in _RENDERER_MODULES:
+        return getattr(importlib.import_module(_RENDERER_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
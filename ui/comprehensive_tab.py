@@ -9,13 +9,63 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
 from typing import Dict, List, Tuple, Any, Optional
 from datetime import date
 
 from app_controller import AppController
 from financeModels.comprehensive_proforma import calculate_comprehensive_proforma
-from visualization import setup_plot_style, format_currency as mpl_format_currency
+from visualization import setup_plot_style, format_currency as mpl_format_currency, CURRENCY_FORMATTER, month_start_dates
+from ui.constants import DEFAULT_START_DATE, DEFAULT_END_DATE, MIN_DATE
+
+# The proforma projection is bounded at 2040 rather than the shared 2050
+MAX_DATE = date(2040, 12, 31)
+
+@st.cache_data(show_spinner=False)
+def _cached_comprehensive_proforma(personnel_data: pd.DataFrame, exams_data: pd.DataFrame,
+                                   revenue_data: pd.DataFrame, equipment_data: pd.DataFrame,
+                                   other_data: pd.DataFrame, start_date: str, end_date: str,
+                                   revenue_sources: Tuple[str, ...], work_days_per_year: int,
+                                   days_between_travel: int, miles_per_travel: int,
+                                   population_growth_rates: Tuple[float, ...]) -> Dict:
+    """Calculate the comprehensive proforma, reusing results for unchanged inputs."""
+    return calculate_comprehensive_proforma(
+        personnel_data=personnel_data,
+        exams_data=exams_data,
+        revenue_data=revenue_data,
+        equipment_data=equipment_data,
+        other_data=other_data,
+        start_date=start_date,
+        end_date=end_date,
+        revenue_sources=list(revenue_sources),
+        work_days_per_year=work_days_per_year,
+        days_between_travel=days_between_travel,
+        miles_per_travel=miles_per_travel,
+        population_growth_rates=list(population_growth_rates)
+    )
+
+@st.cache_data(show_spinner=False)
+def _coerce_column_types(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert date- and number-like text columns, reusing results for unchanged data."""
+    df = df.copy()
+    for col in df.columns:
+        # Skip converting true string columns like 'Title', 'Name', etc.
+        if col.lower() in ['title', 'name', 'description', 'type', 'institution', 'category', 'stafftype', 'notes']:
+            continue
+        try:
+            # Only try to convert if the column has mixed types or is an object dtype
+            if df[col].dtype == 'object' or df[col].dtype == 'string':
+                # Handle different date formats first
+                if 'date' in col.lower():
+                    df[col] = pd.to_datetime(df[col], errors='ignore')
+                else:
+                    # For potential numeric columns, remove any currency symbols and commas
+                    df[col] = df[col].astype(str).str.replace('$', '', regex=False)
+                    df[col] = df[col].astype(str).str.replace(',', '', regex=False)
+                    df[col] = pd.to_numeric(df[col], errors='ignore')
+        except Exception:
+            # If conversion fails, leave as is
+            pass
+    return df
 
 # Create a wrapper for format_currency that handles both formatting for matplotlib and for display
 def format_currency(value, include_cents=True, pos=None):
@@ -71,24 +121,24 @@ def render_comprehensive_tab(st_obj):
     with col1:
         start_date = st_obj.date_input(
             "Start Date", 
-            value=pd.to_datetime("01/01/2025").date(),
-            min_value=date(2020, 1, 1),
-            max_value=date(2040, 12, 31),
+            value=DEFAULT_START_DATE,
+            min_value=MIN_DATE,
+            max_value=MAX_DATE,
             key="proforma_start_date"
         )
     with col2:
         end_date = st_obj.date_input(
             "End Date", 
-            value=pd.to_datetime("12/31/2029").date(),
-            min_value=date(2020, 1, 1),
-            max_value=date(2040, 12, 31),
+            value=DEFAULT_END_DATE,
+            min_value=MIN_DATE,
+            max_value=MAX_DATE,
             key="proforma_end_date"
         )
     
     # Revenue source selection
     st_obj.subheader("Select Revenue Sources")
     if 'Revenue' in st_obj.session_state.dataframes:
-        revenue_sources = st_obj.session_state.dataframes['Revenue']['Title'].tolist()
+        revenue_sources = AppController.get_revenue_sources(st_obj.session_state.dataframes['Revenue'])
         selected_sources = st_obj.multiselect(
             "Revenue Sources", 
             revenue_sources, 
@@ -143,29 +193,27 @@ def render_comprehensive_tab(st_obj):
         end_year = end_date.year
         num_years = end_year - start_year + 1
         
-        # Create input fields for each year's growth rate
+        # Create input fields for each year's growth rate, laid out in one grid of
+        # at most five columns (at least one, so an inverted range does not fail)
         growth_rates = []
-        growth_cols = st_obj.columns(min(5, num_years))
+        growth_cols = st_obj.columns(max(1, min(5, num_years)))
         
         # Define default increasing growth rates: 0.05, 0.10, 0.15, 0.2, 0.25
         default_growth_rates = [0.05, 0.10, 0.15, 0.20, 0.25]
         
         for i, year in enumerate(range(start_year, end_year + 1)):
-            col_idx = i % len(growth_cols)
             # Set default value based on year index, reuse the last value if more years than defaults
-            default_value = default_growth_rates[min(i, len(default_growth_rates)-1)] if i < len(default_growth_rates) else default_growth_rates[-1]
+            default_value = default_growth_rates[min(i, len(default_growth_rates) - 1)]
             
-            with growth_cols[col_idx]:
-                growth_rate = st_obj.number_input(
-                    f"Growth {year}",
-                    min_value=-0.5,
-                    max_value=2.0,
-                    value=default_value,
-                    step=0.01,
-                    format="%.2f",
-                    key=f"growth_rate_{year}"
-                )
-                growth_rates.append(growth_rate)
+            growth_rates.append(growth_cols[i % len(growth_cols)].number_input(
+                f"Growth {year}",
+                min_value=-0.5,
+                max_value=2.0,
+                value=default_value,
+                step=0.01,
+                format="%.2f",
+                key=f"growth_rate_{year}"
+            ))
     
     # Generate Proforma button
     if st_obj.button("Generate Comprehensive ProForma", key="generate_proforma_btn"):
@@ -176,57 +224,36 @@ def render_comprehensive_tab(st_obj):
                     start_date_str = start_date.strftime("%m/%d/%Y")
                     end_date_str = end_date.strftime("%m/%d/%Y")
                     
-                    # Get the updated data from the AppController
-                    updated_data = st_obj.session_state.dataframes
+                    # Use the tables already held in session state; only a table that
+                    # was never loaded is read from disk
+                    required_data = ['Personnel', 'Exams', 'Revenue', 'Equipment', 'OtherExpenses']
+                    updated_data = {name: AppController.get_dataframe(name) for name in required_data}
                     
                     # Check if all required data is available
-                    required_data = ['Personnel', 'Exams', 'Revenue', 'Equipment', 'OtherExpenses']
-                    missing_data = [d for d in required_data if d not in updated_data or updated_data[d].empty]
+                    missing_data = [d for d in required_data if updated_data[d] is None or updated_data[d].empty]
                     
                     if missing_data:
                         st_obj.error(f"Missing data: {', '.join(missing_data)}. Please ensure all required data is loaded.")
                     else:
-                        # Ensure numeric data types for calculations
-                        for df_name in updated_data:
-                            # Process each dataframe to ensure numeric columns are properly typed
-                            df = updated_data[df_name]
-                            # Try to convert potentially numeric columns
-                            for col in df.columns:
-                                # Skip converting true string columns like 'Title', 'Name', etc.
-                                if col.lower() in ['title', 'name', 'description', 'type', 'institution', 'category', 'stafftype', 'notes']:
-                                    continue
-                                # Check if column might be numeric
-                                try:
-                                    # Only try to convert if the column has mixed types or is an object dtype
-                                    if df[col].dtype == 'object' or df[col].dtype == 'string':
-                                        # Handle different date formats first
-                                        if 'date' in col.lower():
-                                            df[col] = pd.to_datetime(df[col], errors='ignore')
-                                        else:
-                                            # For potential numeric columns, remove any currency symbols and commas
-                                            df[col] = df[col].astype(str).str.replace('$', '', regex=False)
-                                            df[col] = df[col].astype(str).str.replace(',', '', regex=False)
-                                            df[col] = pd.to_numeric(df[col], errors='ignore')
-                                except Exception:
-                                    # If conversion fails, leave as is
-                                    pass
-                            updated_data[df_name] = df
+                        # Ensure numeric data types for calculations, reusing the
+                        # converted tables while the loaded data is unchanged
+                        updated_data = {name: _coerce_column_types(updated_data[name]) for name in required_data}
                         
                         # Calculate comprehensive proforma
                         try:
-                            proforma_results = calculate_comprehensive_proforma(
-                                personnel_data=updated_data['Personnel'],
-                                exams_data=updated_data['Exams'],
-                                revenue_data=updated_data['Revenue'],
-                                equipment_data=updated_data['Equipment'],
-                                other_data=updated_data['OtherExpenses'],
-                                start_date=start_date_str,
-                                end_date=end_date_str,
-                                revenue_sources=selected_sources,
-                                work_days_per_year=work_days,
-                                days_between_travel=days_between_travel,
-                                miles_per_travel=miles_per_travel,
-                                population_growth_rates=growth_rates
+                            proforma_results = _cached_comprehensive_proforma(
+                                updated_data['Personnel'],
+                                updated_data['Exams'],
+                                updated_data['Revenue'],
+                                updated_data['Equipment'],
+                                updated_data['OtherExpenses'],
+                                start_date_str,
+                                end_date_str,
+                                tuple(selected_sources),
+                                work_days,
+                                days_between_travel,
+                                miles_per_travel,
+                                tuple(growth_rates)
                             )
                             
                             # Store the results in session state for use in other tabs
@@ -338,22 +365,17 @@ def _display_financial_summary(st_obj, annual_summary, financial_metrics):
     # Annual summary table
     st_obj.subheader("Annual Financial Summary")
     
-    # Create a display version of the annual summary
-    display_df = annual_summary.copy()
-    
-    # Format currency columns
+    # Currency columns are formatted at render time, keeping the values numeric
     currency_columns = [
         'Total_Revenue', 'Exam_Revenue', 'Other_Revenue',
         'Total_Expenses', 'Personnel_Expenses', 'Equipment_Expenses',
         'Exam_Direct_Expenses', 'Other_Expenses', 'Net_Income'
     ]
     
-    for col in currency_columns:
-        if col in display_df.columns:
-            display_df[col] = display_df[col].apply(lambda x: format_currency(x, include_cents=False))
-    
     st_obj.dataframe(
-        display_df[['Year'] + currency_columns],
+        annual_summary[['Year'] + currency_columns].style.format(
+            '${:,.0f}', subset=currency_columns, na_rep='$0'
+        ),
         hide_index=True,
         use_container_width=True
     )
@@ -433,8 +455,8 @@ def _display_revenue_expenses(st_obj, annual_summary):
     ax.set_xticklabels(years)
     
     # Format y-axis ticks as currency
-    ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, p: format_currency(x, include_cents=False)))
-    ax2.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, p: format_currency(x, include_cents=False)))
+    ax.yaxis.set_major_formatter(CURRENCY_FORMATTER)
+    ax2.yaxis.set_major_formatter(CURRENCY_FORMATTER)
     
     # Combine legends
     lines1, labels1 = ax.get_legend_handles_labels()
@@ -442,8 +464,9 @@ def _display_revenue_expenses(st_obj, annual_summary):
     ax.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
     
     # Adjust layout and display the plot
-    plt.tight_layout()
+    fig.tight_layout()
     st_obj.pyplot(fig)
+    plt.close(fig)
     
     # Expense breakdown
     st_obj.subheader("Expense Breakdown")
@@ -494,14 +517,15 @@ def _display_revenue_expenses(st_obj, annual_summary):
     ax.set_title('Annual Expense Breakdown by Category')
     
     # Format y-axis ticks as currency
-    ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, p: format_currency(x, include_cents=False)))
+    ax.yaxis.set_major_formatter(CURRENCY_FORMATTER)
     
     # Add legend
     ax.legend(loc='upper left')
     
     # Adjust layout and display the plot
-    plt.tight_layout()
+    fig2.tight_layout()
     st_obj.pyplot(fig2)
+    plt.close(fig2)
 
 def _display_cash_flow(st_obj, monthly_cash_flow):
     """Display the cash flow projection section."""
@@ -518,13 +542,11 @@ def _display_cash_flow(st_obj, monthly_cash_flow):
         return
     
     # Create date column for plotting
-    monthly_cash_flow['Date'] = pd.to_datetime(
-        monthly_cash_flow['Year'].astype(str) + '-' + 
-        monthly_cash_flow['Month'].astype(str) + '-01'
-    )
+    monthly_cash_flow['Date'] = month_start_dates(monthly_cash_flow['Year'], monthly_cash_flow['Month'])
     
-    # Sort by date
-    monthly_cash_flow = monthly_cash_flow.sort_values('Date')
+    # Sort by date (the proforma already builds months in order)
+    if not monthly_cash_flow['Date'].is_monotonic_increasing:
+        monthly_cash_flow = monthly_cash_flow.sort_values('Date')
     
     # Create the plot
     fig, ax = plt.subplots(figsize=(12, 6))
@@ -588,14 +610,15 @@ def _display_cash_flow(st_obj, monthly_cash_flow):
         alpha=0.2
     )
     
-    # Calculate cumulative net income
-    monthly_cash_flow['Cumulative_Net_Income'] = monthly_cash_flow['Net_Income'].cumsum()
+    # Calculate cumulative net income for plotting only; the cash flow table
+    # below computes its own cumulative column from the cash-basis net income
+    cumulative_net_income = monthly_cash_flow['Net_Income'].to_numpy().cumsum()
     
     # Create secondary axis for cumulative net income
     ax2 = ax.twinx()
     ax2.plot(
         monthly_cash_flow['Date'], 
-        monthly_cash_flow['Cumulative_Net_Income'], 
+        cumulative_net_income, 
         marker='d', 
         markersize=4, 
         linewidth=2,
@@ -611,11 +634,11 @@ def _display_cash_flow(st_obj, monthly_cash_flow):
     ax.set_title('Monthly Cash Flow Projection')
     
     # Format dates on x-axis
-    plt.gcf().autofmt_xdate()
+    fig.autofmt_xdate()
     
     # Format y-axis ticks as currency
-    ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, p: format_currency(x, include_cents=False)))
-    ax2.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, p: format_currency(x, include_cents=False)))
+    ax.yaxis.set_major_formatter(CURRENCY_FORMATTER)
+    ax2.yaxis.set_major_formatter(CURRENCY_FORMATTER)
     
     # Combine legends
     lines1, labels1 = ax.get_legend_handles_labels()
@@ -623,8 +646,9 @@ def _display_cash_flow(st_obj, monthly_cash_flow):
     ax.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
     
     # Adjust layout and display the plot
-    plt.tight_layout()
+    fig.tight_layout()
     st_obj.pyplot(fig)
+    plt.close(fig)
     
     # Display monthly cash on hand plot
     st_obj.subheader("Monthly Cash on Hand")
@@ -679,26 +703,25 @@ def _display_cash_flow(st_obj, monthly_cash_flow):
     
     # Remove depreciation from equipment expenses (since it's a non-cash expense)
     if not equipment_purchases.empty and 'AnnualDepreciation' in equipment_purchases.columns:
-        # Process each month to adjust for depreciation and add equipment purchases
-        for i, row in cash_flow.iterrows():
-            year = row['Year']
-            month = row['Month']
+        # Depreciation for each month (annual depreciation / 12), looked up by year
+        # from one per-year total rather than filtering the purchases for every month
+        if 'Equipment_Expenses' in cash_flow.columns:
+            annual_depreciation = equipment_purchases.groupby('Year')['AnnualDepreciation'].sum()
+            monthly_depreciation = cash_flow['Year'].map(annual_depreciation / 12).fillna(0).to_numpy()
             
-            # Find equipment expenses for this year
-            year_equipment = equipment_purchases[equipment_purchases['Year'] == year]
-            
-            if not year_equipment.empty:
-                # Calculate depreciation for this month (annual depreciation / 12)
-                monthly_depreciation = year_equipment['AnnualDepreciation'].sum() / 12
-                
-                # Adjust equipment expenses by removing depreciation
-                if 'Equipment_Expenses' in cash_flow.columns:
-                    cash_flow.at[i, 'Equipment_Expenses'] -= monthly_depreciation
-                    cash_flow.at[i, 'Total_Expenses'] -= monthly_depreciation
-                    cash_flow.at[i, 'Net_Income'] += monthly_depreciation
+            # Adjust equipment expenses by removing depreciation
+            cash_flow['Equipment_Expenses'] -= monthly_depreciation
+            cash_flow['Total_Expenses'] -= monthly_depreciation
+            cash_flow['Net_Income'] += monthly_depreciation
     
     # Add equipment purchase costs as full cash outlays in the month they occur
     if not equipment_data.empty and 'PurchaseDate' in equipment_data.columns:
+        # Map each (Year, Month) to its first cash flow row once, so each order and
+        # delivery date is a dictionary lookup instead of a scan of both columns
+        period_rows = {}
+        for idx, period in zip(cash_flow.index, zip(cash_flow['Year'], cash_flow['Month'])):
+            period_rows.setdefault(period, idx)
+        
         # Process each equipment purchase
         for _, equipment in equipment_data.iterrows():
             if pd.notna(equipment['PurchaseDate']):
@@ -731,11 +754,9 @@ def _display_cash_flow(st_obj, monthly_cash_flow):
                     delivery_month = delivery_date.month
                     
                     # Find the corresponding row for initial payment (order date)
-                    order_idx = cash_flow[(cash_flow['Year'] == purchase_year) & 
-                                        (cash_flow['Month'] == purchase_month)].index
+                    order_idx = period_rows.get((purchase_year, purchase_month))
                     
-                    if not order_idx.empty:
-                        order_idx = order_idx[0]
+                    if order_idx is not None:
                         # Add the initial payment (80%) to equipment purchases
                         cash_flow.at[order_idx, 'Equipment_Purchases'] += initial_payment
                         # Add to total expenses and adjust net income
@@ -753,11 +774,9 @@ def _display_cash_flow(st_obj, monthly_cash_flow):
                             cash_flow.at[order_idx, 'Equipment_Purchase_Details'] = f"{equipment_name}"
                     
                     # Now handle the final payment (delivery date)
-                    delivery_idx = cash_flow[(cash_flow['Year'] == delivery_year) & 
-                                            (cash_flow['Month'] == delivery_month)].index
+                    delivery_idx = period_rows.get((delivery_year, delivery_month))
                     
-                    if not delivery_idx.empty and (construction_time > 0 or delivery_month != purchase_month or delivery_year != purchase_year):
-                        delivery_idx = delivery_idx[0]
+                    if delivery_idx is not None and (construction_time > 0 or delivery_month != purchase_month or delivery_year != purchase_year):
                         # Add the final payment (20%) to equipment purchases
                         cash_flow.at[delivery_idx, 'Equipment_Purchases'] += final_payment
                         # Add to total expenses and adjust net income
@@ -776,7 +795,7 @@ def _display_cash_flow(st_obj, monthly_cash_flow):
                     else:
                         # If delivery is in same month as purchase or we don't have a matching row, 
                         # add the final payment to the initial payment month
-                        if not order_idx.empty:
+                        if order_idx is not None:
                             cash_flow.at[order_idx, 'Equipment_Purchases'] += final_payment
                             cash_flow.at[order_idx, 'Total_Expenses'] += final_payment
                             cash_flow.at[order_idx, 'Net_Income'] -= final_payment
@@ -784,11 +803,10 @@ def _display_cash_flow(st_obj, monthly_cash_flow):
                 except Exception as e:
                     st_obj.error(f"Error processing equipment purchase: {str(e)}")
     
-    # Recalculate cumulative net income based on cash flow
-    cash_flow['Cumulative_Net_Income'] = cash_flow['Net_Income'].cumsum()
-    
-    # Calculate cash on hand
-    cash_flow['Cash_On_Hand'] = initial_cash + cash_flow['Cumulative_Net_Income']
+    # Calculate cumulative net income based on cash flow, and cash on hand from it
+    cash_cumulative_net_income = cash_flow['Net_Income'].to_numpy().cumsum()
+    cash_flow['Cumulative_Net_Income'] = cash_cumulative_net_income
+    cash_flow['Cash_On_Hand'] = initial_cash + cash_cumulative_net_income
     
     # Create the cash on hand plot
     fig3, ax = plt.subplots(figsize=(12, 6))
@@ -864,10 +882,10 @@ def _display_cash_flow(st_obj, monthly_cash_flow):
     ax.set_title('Monthly Cash on Hand Projection (True Cash Basis)')
     
     # Format dates on x-axis
-    plt.gcf().autofmt_xdate()
+    fig3.autofmt_xdate()
     
     # Format y-axis ticks as currency
-    ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, p: format_currency(x, include_cents=False)))
+    ax.yaxis.set_major_formatter(CURRENCY_FORMATTER)
     
     # Add minimum cash position line
     min_cash = cash_flow['Cash_On_Hand'].min()
@@ -897,8 +915,9 @@ def _display_cash_flow(st_obj, monthly_cash_flow):
     ax.legend()
     
     # Adjust layout and display the plot
-    plt.tight_layout()
+    fig3.tight_layout()
     st_obj.pyplot(fig3)
+    plt.close(fig3)
     
     # Add a note about the equipment purchases
     st_obj.caption(
@@ -926,10 +945,6 @@ def _display_cash_flow(st_obj, monthly_cash_flow):
     if 'Equipment_Purchases' in display_df.columns:
         currency_columns.append('Equipment_Purchases')
     
-    for col in currency_columns:
-        if col in display_df.columns:
-            display_df[col] = display_df[col].apply(lambda x: format_currency(x, include_cents=False))
-    
     # Select columns for display
     display_cols = ['Month/Year', 'Total_Revenue', 'Total_Expenses']
     
@@ -942,7 +957,9 @@ def _display_cash_flow(st_obj, monthly_cash_flow):
     display_cols.extend(['Net_Income', 'Cumulative_Net_Income', 'Cash_On_Hand'])
     
     st_obj.dataframe(
-        display_df[display_cols],
+        display_df[display_cols].style.format(
+            '${:,.0f}', subset=[col for col in display_cols if col in currency_columns], na_rep='$0'
+        ),
         hide_index=True,
         use_container_width=True
     )
@@ -1038,8 +1055,9 @@ def _display_financial_metrics(st_obj, financial_metrics):
         ax.set_title('Annual Return on Investment')
         
         # Adjust layout and display the plot
-        plt.tight_layout()
+        fig.tight_layout()
         st_obj.pyplot(fig)
+        plt.close(fig)
 
 def _display_raw_data(st_obj, annual_summary):
     """Display the raw data section."""
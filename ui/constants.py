@@ -0,0 +1,11 @@
+"""
+Constants shared by the tabs of the CAREScan ProForma Editor application.
+"""
+
+from datetime import date
+
+# Date input defaults and bounds
+DEFAULT_START_DATE = date(2025, 1, 1)
+DEFAULT_END_DATE = date(2029, 12, 31)
+MIN_DATE = date(2020, 1, 1)
+MAX_DATE = date(2050, 12, 31)
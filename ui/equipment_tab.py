@@ -7,13 +7,29 @@ This module contains the UI components and logic for the Equipment tab.
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
 from typing import Dict, List, Tuple, Any, Optional
-from datetime import date
 
 from app_controller import AppController
 from financeModels.equipment_expenses import EquipmentExpenseCalculator, calculate_equipment_expenses
-from visualization import create_equipment_expenses_plot, setup_plot_style, format_currency
+from visualization import create_equipment_expenses_plot, setup_plot_style, format_currency, get_session_figure, CURRENCY_FORMATTER
+from ui.constants import DEFAULT_START_DATE, DEFAULT_END_DATE, MIN_DATE, MAX_DATE
+
+# Maximum number of points drawn per line series
+MAX_LINE_PLOT_POINTS = 500
+
+@st.cache_data(show_spinner=False)
+def _cached_equipment_expenses(equipment_data: pd.DataFrame, start_date: str, end_date: str,
+                               days_between_travel: int, miles_per_travel: int,
+                               depreciation_method: str) -> Dict:
+    """Calculate equipment expenses, reusing results for unchanged inputs."""
+    return calculate_equipment_expenses(
+        equipment_data=equipment_data,
+        start_date=start_date,
+        end_date=end_date,
+        days_between_travel=days_between_travel,
+        miles_per_travel=miles_per_travel,
+        depreciation_method=depreciation_method
+    )
 
 def render_equipment_tab(st_obj):
     """
@@ -65,8 +81,8 @@ def render_equipment_tab(st_obj):
                 "Purchase Date",
                 help="Date of purchase or planned purchase",
                 format="MM/DD/YYYY",
-                min_value=date(2020, 1, 1),
-                max_value=date(2050, 12, 31)
+                min_value=MIN_DATE,
+                max_value=MAX_DATE
             ),
             "Cost": st_obj.column_config.NumberColumn(
                 "Cost ($)",
@@ -93,13 +109,15 @@ def render_equipment_tab(st_obj):
     # Save changes if data was edited
     if not edited_df.equals(equipment_df):
         if st_obj.button("Save Equipment Changes"):
-            # Convert datetime objects back to string format before saving
-            save_df = edited_df.copy()
+            # Convert datetime objects back to string format before saving,
+            # replacing only the date column instead of copying the frame
+            date_columns = {}
             try:
-                if "Purchase_Date" in save_df.columns:
-                    save_df["Purchase_Date"] = save_df["Purchase_Date"].dt.strftime('%m/%d/%Y')
+                if "Purchase_Date" in edited_df.columns:
+                    date_columns["Purchase_Date"] = edited_df["Purchase_Date"].dt.strftime('%m/%d/%Y')
             except Exception as e:
                 st_obj.warning(f"Could not format date columns for saving: {str(e)}")
+            save_df = edited_df.assign(**date_columns)
             
             save_result = AppController.save_dataframe("Equipment", save_df)
             if save_result:
@@ -117,17 +135,17 @@ def render_equipment_tab(st_obj):
     with col1:
         start_date = st_obj.date_input(
             "Start Date",
-            value=pd.to_datetime("01/01/2025").date(),
-            min_value=date(2020, 1, 1),
-            max_value=date(2050, 12, 31),
+            value=DEFAULT_START_DATE,
+            min_value=MIN_DATE,
+            max_value=MAX_DATE,
             key="equipment_start_date"
         )
     with col2:
         end_date = st_obj.date_input(
             "End Date",
-            value=pd.to_datetime("12/31/2029").date(),
-            min_value=date(2020, 1, 1),
-            max_value=date(2050, 12, 31),
+            value=DEFAULT_END_DATE,
+            min_value=MIN_DATE,
+            max_value=MAX_DATE,
             key="equipment_end_date"
         )
     
@@ -172,7 +190,7 @@ def render_equipment_tab(st_obj):
                 end_date_str = end_date.strftime("%m/%d/%Y")
                 
                 # Calculate equipment expenses - passing parameters directly instead of as a dictionary
-                results = calculate_equipment_expenses(
+                results = _cached_equipment_expenses(
                     equipment_data=equipment_df,
                     start_date=start_date_str,
                     end_date=end_date_str,
@@ -191,6 +209,8 @@ def render_equipment_tab(st_obj):
             import traceback
             st_obj.error(f"Error calculating equipment expenses: {str(e)}")
             st_obj.error(traceback.format_exc())
+            # Release any pyplot figures left open by the failed render
+            plt.close('all')
 
 def render_equipment_results(st_obj, results, equipment_df, start_date, end_date):
     """
@@ -244,42 +264,38 @@ def render_equipment_results(st_obj, results, equipment_df, start_date, end_date
     # Display equipment summary table
     st_obj.subheader("Equipment Expense Summary")
     
-    # Format the table for display
-    display_df = expenses_by_equipment.copy()
-    for col in ['PurchaseCost', 'AnnualDepreciation', 'ServiceCost', 
-              'AccreditationCost', 'InsuranceCost', 'TravelExpense', 'TotalAnnualExpense']:
-        if col in display_df.columns:
-            display_df[col] = display_df[col].map('${:,.2f}'.format)
+    # Format the table for display, keeping the underlying values numeric
+    money_cols = [col for col in ['PurchaseCost', 'AnnualDepreciation', 'ServiceCost', 
+                                  'AccreditationCost', 'InsuranceCost', 'TravelExpense', 'TotalAnnualExpense']
+                  if col in expenses_by_equipment.columns]
     
-    st_obj.dataframe(display_df)
+    st_obj.dataframe(expenses_by_equipment.style.format('${:,.2f}', subset=money_cols))
     
     # 1. Annual Expenses by Equipment Type
     st_obj.subheader("Annual Expenses by Equipment Type")
     
     if 'Title' in annual_expenses.columns:
-        fig1, ax1 = plt.subplots(figsize=(12, 6))
+        fig1, ax1 = get_session_figure('equipment_fig1', figsize=(12, 6))
         
         # Plot stacked bar chart of expenses by equipment type
-        pivot_df = annual_expenses.pivot_table(
-            index='Title',
-            values=['ServiceCost', 'AccreditationCost', 'InsuranceCost', 'TravelExpense'],
-            aggfunc='sum'
-        )
+        pivot_df = annual_expenses.groupby('Title')[
+            ['AccreditationCost', 'InsuranceCost', 'ServiceCost', 'TravelExpense']
+        ].sum()
         
         pivot_df.plot(kind='bar', stacked=True, ax=ax1)
         ax1.set_title('Annual Expenses by Equipment Type')
         ax1.set_xlabel('Equipment')
         ax1.set_ylabel('Annual Expense ($)')
         ax1.grid(axis='y', linestyle='--', alpha=0.7)
-        plt.xticks(rotation=45)
-        plt.tight_layout()
+        ax1.tick_params(axis='x', rotation=45)
+        fig1.tight_layout()
         st_obj.pyplot(fig1)
     
     # 2. Annual Depreciation by Equipment Type
     st_obj.subheader("Annual Depreciation by Equipment Type")
     
     if 'Title' in expenses_by_equipment.columns and 'AnnualDepreciation' in expenses_by_equipment.columns:
-        fig2, ax2 = plt.subplots(figsize=(12, 6))
+        fig2, ax2 = get_session_figure('equipment_fig2', figsize=(12, 6))
         
         # Plot bar chart of annual depreciation
         depreciation_by_equipment = expenses_by_equipment.set_index('Title')['AnnualDepreciation']
@@ -289,11 +305,10 @@ def render_equipment_results(st_obj, results, equipment_df, start_date, end_date
         ax2.set_ylabel('Annual Depreciation ($)')
         ax2.grid(axis='y', linestyle='--', alpha=0.7)
         
-        for i, v in enumerate(depreciation_by_equipment):
-            ax2.text(i, v + 0.1, f"${v:,.0f}", ha='center')
+        ax2.bar_label(ax2.containers[0], fmt='${:,.0f}', padding=3)
         
-        plt.xticks(rotation=45)
-        plt.tight_layout()
+        ax2.tick_params(axis='x', rotation=45)
+        fig2.tight_layout()
         st_obj.pyplot(fig2)
     
     # 3. Annual Expenses Over Time
@@ -310,11 +325,14 @@ def render_equipment_results(st_obj, results, equipment_df, start_date, end_date
             'TotalAnnualExpense': 'sum'
         })
         
-        # Create line chart of expenses over time
-        fig3, ax3 = plt.subplots(figsize=(12, 6))
+        # Create line chart of expenses over time, thinning the series if there
+        # are more points than can be drawn meaningfully (the table keeps all rows)
+        fig3, ax3 = get_session_figure('equipment_fig3', figsize=(12, 6))
+        stride = max(1, len(yearly_expenses) // MAX_LINE_PLOT_POINTS)
+        plot_frame = yearly_expenses.iloc[::stride]
         
         # Use distinct colors, line styles, and markers for each expense type
-        yearly_expenses['ServiceCost'].plot(
+        plot_frame['ServiceCost'].plot(
             kind='line', 
             marker='o',
             ax=ax3,
@@ -323,7 +341,7 @@ def render_equipment_results(st_obj, results, equipment_df, start_date, end_date
             label='Service Cost'
         )
         
-        yearly_expenses['AccreditationCost'].plot(
+        plot_frame['AccreditationCost'].plot(
             kind='line', 
             marker='s',
             ax=ax3,
@@ -333,7 +351,7 @@ def render_equipment_results(st_obj, results, equipment_df, start_date, end_date
             label='Accreditation Cost'
         )
         
-        yearly_expenses['InsuranceCost'].plot(
+        plot_frame['InsuranceCost'].plot(
             kind='line', 
             marker='^',
             ax=ax3,
@@ -343,7 +361,7 @@ def render_equipment_results(st_obj, results, equipment_df, start_date, end_date
             label='Insurance Cost'
         )
         
-        yearly_expenses['TravelExpense'].plot(
+        plot_frame['TravelExpense'].plot(
             kind='line', 
             marker='d',
             ax=ax3,
@@ -353,7 +371,7 @@ def render_equipment_results(st_obj, results, equipment_df, start_date, end_date
             label='Travel Expense'
         )
         
-        yearly_expenses['AnnualDepreciation'].plot(
+        plot_frame['AnnualDepreciation'].plot(
             kind='line', 
             marker='x',
             ax=ax3,
@@ -368,38 +386,32 @@ def render_equipment_results(st_obj, results, equipment_df, start_date, end_date
         ax3.grid(True, linestyle='--', alpha=0.7)
         
         # Format y-axis with dollar signs
-        fmt = '${x:,.0f}'
-        tick = mticker.StrMethodFormatter(fmt)
-        ax3.yaxis.set_major_formatter(tick)
+        ax3.yaxis.set_major_formatter(CURRENCY_FORMATTER)
         
         # Ensure legend is visible and clear
         ax3.legend(loc='best', frameon=True, fancybox=True, shadow=True)
         
-        # Add data labels to the end points for better readability
-        for column in ['ServiceCost', 'AccreditationCost', 'InsuranceCost', 'TravelExpense', 'AnnualDepreciation']:
-            last_year = yearly_expenses.index[-1]
-            last_value = yearly_expenses.loc[last_year, column]
+        # Add data labels to the end points for better readability,
+        # looking up the final year's values once for all series
+        last_year = yearly_expenses.index[-1]
+        last_values = yearly_expenses.iloc[-1][['ServiceCost', 'AccreditationCost', 'InsuranceCost', 'TravelExpense', 'AnnualDepreciation']]
+        for last_value in last_values:
             ax3.annotate(f'${last_value:,.0f}', 
                         xy=(last_year, last_value),
                         xytext=(10, 0),
                         textcoords='offset points',
                         va='center')
         
-        plt.tight_layout()
+        fig3.tight_layout()
         st_obj.pyplot(fig3)
         
-        # Format and display the yearly expenses table with dollar formatting
-        display_yearly = yearly_expenses.reset_index().copy()
-        for col in display_yearly.columns:
-            if col != 'Year':
-                display_yearly[col] = display_yearly[col].map('${:,.2f}'.format)
-        
-        st_obj.dataframe(display_yearly)
+        # Display the yearly expenses table with dollar formatting
+        st_obj.dataframe(yearly_expenses.style.format('${:,.2f}'))
         
         # 4. Total Annual Cost vs. Depreciation
         st_obj.subheader("Total Annual Cost vs. Depreciation")
         
-        fig4, ax4 = plt.subplots(figsize=(12, 6))
+        fig4, ax4 = get_session_figure('equipment_fig4', figsize=(12, 6))
         
         # Create a new DataFrame with just Annual Expenses and Depreciation
         cost_vs_depreciation = pd.DataFrame({
@@ -412,5 +424,5 @@ def render_equipment_results(st_obj, results, equipment_df, start_date, end_date
         ax4.set_xlabel('Year')
         ax4.set_ylabel('Amount ($)')
         ax4.grid(axis='y', linestyle='--', alpha=0.7)
-        plt.tight_layout()
+        fig4.tight_layout()
         st_obj.pyplot(fig4) 
\ No newline at end of file
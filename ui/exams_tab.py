@@ -9,13 +9,40 @@ import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
-import matplotlib.ticker as mticker
 from typing import Dict, List, Tuple, Any, Optional
-from datetime import date
+from functools import lru_cache
 
 from app_controller import AppController
 from financeModels.exam_revenue import ExamRevenueCalculator, calculate_exam_revenue
-from visualization import setup_plot_style, format_currency
+from visualization import setup_plot_style, format_currency, get_session_figure, CURRENCY_FORMATTER
+from ui.constants import DEFAULT_START_DATE, DEFAULT_END_DATE, MIN_DATE, MAX_DATE
+
+@lru_cache(maxsize=None)
+def _top_exam_colors(n: int) -> np.ndarray:
+    """Return the bar colors for a top exams chart with n bars."""
+    colors = plt.cm.YlOrRd(np.linspace(0.2, 0.8, n))
+    colors.flags.writeable = False
+    return colors
+
+@st.cache_data(show_spinner=False)
+def _cached_exam_revenue(exams_data: pd.DataFrame, revenue_data: pd.DataFrame,
+                         personnel_data: pd.DataFrame, equipment_data: pd.DataFrame,
+                         start_date: str, start_year: int, end_year: int,
+                         revenue_sources: Tuple[str, ...], work_days_per_year: int) -> pd.DataFrame:
+    """Calculate multi-year exam revenue, reusing results for unchanged inputs."""
+    calculator = ExamRevenueCalculator(
+        exams_data=exams_data,
+        revenue_data=revenue_data,
+        personnel_data=personnel_data,
+        equipment_data=equipment_data,
+        start_date=start_date
+    )
+    return calculator.calculate_multi_year_exam_revenue(
+        start_year=start_year,
+        end_year=end_year,
+        revenue_sources=list(revenue_sources),
+        work_days_per_year=work_days_per_year
+    )
 
 def render_exams_tab(st_obj):
     """
@@ -177,17 +204,17 @@ def render_exams_tab(st_obj):
     with col1:
         start_date = st_obj.date_input(
             "Start Date", 
-            value=pd.to_datetime("01/01/2025").date(),
-            min_value=date(2020, 1, 1),
-            max_value=date(2050, 12, 31),
+            value=DEFAULT_START_DATE,
+            min_value=MIN_DATE,
+            max_value=MAX_DATE,
             key="exam_start_date"
         )
     with col2:
         end_date = st_obj.date_input(
             "End Date", 
-            value=pd.to_datetime("12/31/2029").date(),
-            min_value=date(2020, 1, 1),
-            max_value=date(2050, 12, 31),
+            value=DEFAULT_END_DATE,
+            min_value=MIN_DATE,
+            max_value=MAX_DATE,
             key="exam_end_date"
         )
     
@@ -195,7 +222,7 @@ def render_exams_tab(st_obj):
     st_obj.write("##### Select Revenue Sources")
     revenue_df = AppController.get_dataframe("Revenue")
     if revenue_df is not None and not revenue_df.empty and 'Title' in revenue_df.columns:
-        revenue_sources = revenue_df['Title'].tolist()
+        revenue_sources = AppController.get_revenue_sources(revenue_df)
         selected_sources = st_obj.multiselect(
             "Revenue Sources", 
             revenue_sources, 
@@ -220,8 +247,10 @@ def render_exams_tab(st_obj):
         try:
             with st_obj.spinner("Calculating exam revenue and generating plots..."):
                 # Check if required data is available
+                # (tables missing from session state are loaded once, not on every click)
                 required_tables = ['Revenue', 'Exams', 'Personnel', 'Equipment']
-                missing_tables = [table for table in required_tables if table not in st_obj.session_state.dataframes or st_obj.session_state.dataframes[table].empty]
+                frames = {table: AppController.get_dataframe(table) for table in required_tables}
+                missing_tables = [table for table, df in frames.items() if df is None or df.empty]
                 
                 if missing_tables:
                     st_obj.error(f"The following required data is missing: {', '.join(missing_tables)}")
@@ -232,22 +261,37 @@ def render_exams_tab(st_obj):
                     start_year = start_date.year
                     end_year = end_date.year
                     
-                    # Initialize the calculator
-                    calculator = ExamRevenueCalculator(
-                        exams_data=st_obj.session_state.dataframes['Exams'],
-                        revenue_data=st_obj.session_state.dataframes['Revenue'],
-                        personnel_data=st_obj.session_state.dataframes['Personnel'],
-                        equipment_data=st_obj.session_state.dataframes['Equipment'],
-                        start_date=start_date.strftime('%m/%d/%Y')
-                    )
-                    
-                    # Calculate exam revenue for all selected sources
-                    results = calculator.calculate_multi_year_exam_revenue(
-                        start_year=start_year,
-                        end_year=end_year,
-                        revenue_sources=selected_sources,
-                        work_days_per_year=work_days
+                    # Reuse the last results when neither the inputs nor the loaded
+                    # tables have changed, skipping the cache lookup's DataFrame hashing.
+                    # The tables are kept alongside the key so their ids stay unique.
+                    tables = tuple(frames[table] for table in required_tables)
+                    input_key = (
+                        start_date.isoformat(),
+                        end_date.isoformat(),
+                        tuple(sorted(selected_sources)),
+                        work_days,
+                        tuple(id(table) for table in tables)
                     )
+                    if (st_obj.session_state.get('exam_last_key') == input_key
+                            and 'exam_last_results' in st_obj.session_state):
+                        results = st_obj.session_state['exam_last_results']
+                    else:
+                        # Calculate exam revenue for all selected sources; sorting the
+                        # sources makes the cache key independent of selection order
+                        results = _cached_exam_revenue(
+                            frames['Exams'],
+                            frames['Revenue'],
+                            frames['Personnel'],
+                            frames['Equipment'],
+                            start_date.strftime('%m/%d/%Y'),
+                            start_year,
+                            end_year,
+                            tuple(sorted(selected_sources)),
+                            work_days
+                        )
+                        st_obj.session_state['exam_last_key'] = input_key
+                        st_obj.session_state['exam_last_tables'] = tables
+                        st_obj.session_state['exam_last_results'] = results
                     
                     # Store results
                     AppController.store_calculation_result("exam_revenue", results)
@@ -278,11 +322,20 @@ def render_exam_results(st_obj, results, exams_df, start_date, end_date):
     # Display key metrics
     st_obj.subheader("Key Metrics Summary")
     
+    # Aggregate all per-year totals in a single groupby pass
+    by_year = results.groupby('Year').agg(
+        AnnualVolume=('AnnualVolume', 'sum'),
+        Total_Revenue=('Total_Revenue', 'sum'),
+        Total_Direct_Expenses=('Total_Direct_Expenses', 'sum'),
+        Net_Revenue=('Net_Revenue', 'sum')
+    )
+    by_exam = results.groupby('Exam').agg(
+        AnnualVolume=('AnnualVolume', 'sum'),
+        Total_Revenue=('Total_Revenue', 'sum')
+    )
+    
     # Calculate summary metrics
-    total_volume = results['AnnualVolume'].sum()
-    total_revenue = results['Total_Revenue'].sum()
-    total_expenses = results['Total_Direct_Expenses'].sum()
-    net_revenue = results['Net_Revenue'].sum()
+    total_volume, total_revenue, total_expenses, net_revenue = by_year.sum()
     
     # Display metrics in columns
     metric_col1, metric_col2, metric_col3, metric_col4 = st_obj.columns(4)
@@ -297,70 +350,40 @@ def render_exam_results(st_obj, results, exams_df, start_date, end_date):
     
     # 1. Total Revenue by Year and Revenue Source
     st_obj.subheader("Total Revenue by Year and Revenue Source")
-    fig1, ax1 = plt.subplots(figsize=(12, 6))
-    revenue_by_source = results.groupby(['Year', 'RevenueSource'])['Total_Revenue'].sum().unstack()
-    revenue_by_source.plot(kind='bar', stacked=True, ax=ax1, colormap='viridis')
-    ax1.set_title('Total Revenue by Year and Revenue Source')
-    ax1.set_xlabel('Year')
-    ax1.set_ylabel('Revenue ($)')
-    ax1.grid(axis='y', linestyle='--', alpha=0.7)
-    ax1.legend(title='Revenue Source')
-    
-    # Format y-axis with dollar signs
-    fmt = '${x:,.0f}'
-    tick = mticker.StrMethodFormatter(fmt)
-    ax1.yaxis.set_major_formatter(tick)
+    revenue_by_source = results.pivot_table(
+        index='Year', columns='RevenueSource', values='Total_Revenue', aggfunc='sum', fill_value=0
+    )
     
-    st_obj.pyplot(fig1)
+    # Render simple bar charts client-side; string years give one bar per year
+    st_obj.bar_chart(revenue_by_source.rename(index=str), x_label='Year', y_label='Revenue ($)')
     
     # Show summary table
-    # Format the table for display
-    display_revenue = revenue_by_source.copy()
-    for col in display_revenue.columns:
-        display_revenue[col] = display_revenue[col].map('${:,.2f}'.format)
-    
-    st_obj.dataframe(display_revenue)
+    st_obj.dataframe(revenue_by_source.style.format('${:,.2f}'))
     
     # 2. Exam Volume by Year
     st_obj.subheader("Exam Volume by Year")
-    fig2, ax2 = plt.subplots(figsize=(12, 6))
-    volume_by_year = results.groupby('Year')['AnnualVolume'].sum()
+    fig2, ax2 = get_session_figure('exam_fig2', figsize=(12, 6))
+    volume_by_year = by_year['AnnualVolume']
     volume_by_year.plot(kind='bar', ax=ax2, color='skyblue')
     ax2.set_title('Total Exam Volume by Year')
     ax2.set_xlabel('Year')
     ax2.set_ylabel('Annual Volume')
     ax2.grid(axis='y', linestyle='--', alpha=0.7)
-    for i, v in enumerate(volume_by_year):
-        ax2.text(i, v + 0.1, f"{v:,.0f}", ha='center')
+    ax2.bar_label(ax2.containers[0], fmt='{:,.0f}')
     st_obj.pyplot(fig2)
     
     # 3. Revenue vs Expenses by Year
     st_obj.subheader("Revenue vs Expenses by Year")
-    fig3, ax3 = plt.subplots(figsize=(12, 6))
-    financials = results.groupby('Year').agg({
-        'Total_Revenue': 'sum',
-        'Total_Direct_Expenses': 'sum'
-    })
-    financials.plot(kind='bar', ax=ax3)
-    ax3.set_title('Revenue vs Direct Expenses by Year')
-    ax3.set_xlabel('Year')
-    ax3.set_ylabel('Amount ($)')
-    ax3.grid(axis='y', linestyle='--', alpha=0.7)
-    
-    # Format y-axis with dollar signs
-    ax3.yaxis.set_major_formatter(tick)
-    
-    st_obj.pyplot(fig3)
+    financials = by_year[['Total_Revenue', 'Total_Direct_Expenses']]
+    st_obj.bar_chart(financials.rename(index=str), x_label='Year', y_label='Amount ($)', stack=False)
     
     # 4. Top Exams by Revenue
     st_obj.subheader("Top Exams by Revenue")
-    exam_revenue = results.groupby('Exam')['Total_Revenue'].sum().sort_values(ascending=False)
-    fig4, ax4 = plt.subplots(figsize=(12, 6))
+    fig4, ax4 = get_session_figure('exam_fig4', figsize=(12, 6))
     
     # Plot top 10 exams
-    top_exams = exam_revenue.head(10)
-    colors = plt.cm.YlOrRd(np.linspace(0.2, 0.8, len(top_exams)))
-    top_exams.plot(kind='bar', ax=ax4, color=colors)
+    top_exams = by_exam['Total_Revenue'].nlargest(10)
+    top_exams.plot(kind='bar', ax=ax4, color=_top_exam_colors(len(top_exams)))
     ax4.set_title('Top 10 Exams by Total Revenue')
     ax4.set_xlabel('Exam')
     ax4.set_ylabel('Total Revenue ($)')
@@ -368,7 +391,7 @@ def render_exam_results(st_obj, results, exams_df, start_date, end_date):
     ax4.tick_params(axis='x', rotation=45)
     
     # Format y-axis with dollar signs
-    ax4.yaxis.set_major_formatter(tick)
+    ax4.yaxis.set_major_formatter(CURRENCY_FORMATTER)
     
     st_obj.pyplot(fig4)
     
@@ -380,24 +403,17 @@ def render_exam_results(st_obj, results, exams_df, start_date, end_date):
     selected_year = st_obj.selectbox("Select Year for Detailed View", all_years, key="detail_year_select")
     
     # Filter the results for the selected year
-    year_results = results[results['Year'] == selected_year].copy()
-    
-    # Format currency columns
-    for col in ['Total_Revenue', 'Total_Direct_Expenses', 'Net_Revenue']:
-        if col in year_results.columns:
-            year_results[col] = year_results[col].map('${:,.2f}'.format)
+    year_results = results[results['Year'] == selected_year]
     
-    # Display the detailed table
-    st_obj.dataframe(year_results, use_container_width=True)
+    # Display the detailed table with currency columns formatted
+    money_cols = [col for col in ['Total_Revenue', 'Total_Direct_Expenses', 'Net_Revenue'] if col in year_results.columns]
+    st_obj.dataframe(year_results.style.format('${:,.2f}', subset=money_cols), use_container_width=True)
     
     # 6. Exam Volume Distribution
     st_obj.subheader("Exam Volume Distribution")
     
     # Aggregate exam volumes across all years
-    volume_by_exam = results.groupby('Exam')['AnnualVolume'].sum().sort_values(ascending=False)
-    
-    # Create pie chart
-    fig5, ax5 = plt.subplots(figsize=(10, 10))
+    volume_by_exam = by_exam['AnnualVolume'].sort_values(ascending=False)
     
     # Limit to top 15 exams for readability, group the rest as "Other"
     if len(volume_by_exam) > 15:
@@ -407,26 +423,40 @@ def render_exam_results(st_obj, results, exams_df, start_date, end_date):
     else:
         plot_data = volume_by_exam
     
-    # Create pie chart
-    ax5.pie(
-        plot_data, 
-        labels=plot_data.index, 
-        autopct='%1.1f%%',
-        startangle=90, 
-        shadow=False,
-        wedgeprops={'edgecolor': 'w', 'linewidth': 1},
-        textprops={'fontsize': 9}
-    )
-    
-    ax5.set_title('Exam Volume Distribution')
-    ax5.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
+    # Zero-volume slices draw nothing; skip the figure entirely when all are zero
+    plot_data = plot_data[plot_data > 0]
     
-    st_obj.pyplot(fig5)
+    if plot_data.empty:
+        st_obj.info("No exam volume to display for the selected period.")
+    else:
+        fig5, ax5 = get_session_figure('exam_fig5', figsize=(10, 10))
+        
+        # Create pie chart
+        ax5.pie(
+            plot_data, 
+            labels=plot_data.index, 
+            autopct='%1.1f%%',
+            startangle=90, 
+            shadow=False,
+            wedgeprops={'edgecolor': 'w', 'linewidth': 1},
+            textprops={'fontsize': 9}
+        )
+        
+        ax5.set_title('Exam Volume Distribution')
+        ax5.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
+        
+        st_obj.pyplot(fig5)
     
     # Display volume by exam as dataframe
     display_volume = pd.DataFrame(volume_by_exam).reset_index()
     display_volume.columns = ['Exam', 'Total Volume']
-    display_volume['Percentage'] = (display_volume['Total Volume'] / display_volume['Total Volume'].sum()) * 100
-    display_volume['Percentage'] = display_volume['Percentage'].map('{:.1f}%'.format)
+    # Scale in place with one multiplier rather than dividing then multiplying into temporaries
+    total_volume = display_volume['Total Volume'].sum()
+    percentage = display_volume['Total Volume'].to_numpy(dtype=float, copy=True)
+    if total_volume > 0:
+        percentage *= 100.0 / total_volume
+    else:
+        percentage[:] = 0.0
+    display_volume['Percentage'] = percentage
     
-    st_obj.dataframe(display_volume, use_container_width=True) 
\ No newline at end of file
+    st_obj.dataframe(display_volume.style.format({'Percentage': '{:.1f}%'}), use_container_width=True) 
\ No newline at end of file
@@ -4,16 +4,46 @@ Other expenses tab for the CAREScan ProForma Editor.
 This module contains the UI components and logic for the Other Expenses tab.
 """
 
+import io
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
 from typing import Dict, List, Tuple, Any, Optional
-from datetime import date
 
 from app_controller import AppController
 from financeModels.other_expenses import OtherExpensesCalculator, calculate_other_expenses
-from visualization import setup_plot_style, format_currency
+from visualization import setup_plot_style, format_currency, month_start_dates, CURRENCY_FORMATTER
+from ui.constants import DEFAULT_START_DATE, DEFAULT_END_DATE, MIN_DATE, MAX_DATE
+
+@st.cache_data(show_spinner=False)
+def _cached_other_expenses(other_data: pd.DataFrame, start_date: str, end_date: str) -> Dict:
+    """Calculate other expenses and revenue, reusing results for unchanged inputs."""
+    return calculate_other_expenses(
+        other_data=other_data,
+        start_date=start_date,
+        end_date=end_date
+    )
+
+@st.cache_data(show_spinner=False)
+def _render_title_bars(df: pd.DataFrame, title: str, color: str) -> bytes:
+    """Draw a horizontal bar chart of amounts by title as PNG, reusing the image for unchanged data."""
+    fig, ax = plt.subplots(figsize=(12, 6))
+    
+    # Create horizontal bar chart
+    bars = ax.barh(df['Title'], df['Amount'], color=color)
+    
+    # Add amount labels
+    ax.bar_label(bars, fmt='${:,.0f}', padding=3)
+    
+    ax.set_title(title)
+    ax.set_xlabel('Amount ($)')
+    ax.grid(axis='x', linestyle='--', alpha=0.7)
+    fig.tight_layout()
+    
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=200, bbox_inches='tight')
+    plt.close(fig)
+    return buffer.getvalue()
 
 def render_other_expenses_tab(st_obj):
     """
@@ -71,8 +101,8 @@ def render_other_expenses_tab(st_obj):
                 "Applied Date",
                 help="Date when the expense/revenue is applied",
                 format="MM/DD/YYYY",
-                min_value=date(2020, 1, 1),
-                max_value=date(2050, 12, 31)
+                min_value=MIN_DATE,
+                max_value=MAX_DATE
             ),
             "Amount": st_obj.column_config.NumberColumn(
                 "Amount ($)",
@@ -98,13 +128,15 @@ def render_other_expenses_tab(st_obj):
         col1, col2 = st_obj.columns([1, 5])
         with col1:
             if st_obj.button("Save Changes"):
-                # Convert datetime objects back to string format before saving
-                save_df = edited_df.copy()
+                # Convert datetime objects back to string format before saving,
+                # replacing only the date column instead of copying the frame
+                date_columns = {}
                 try:
-                    if "AppliedDate" in save_df.columns:
-                        save_df["AppliedDate"] = save_df["AppliedDate"].dt.strftime('%m/%d/%Y')
+                    if "AppliedDate" in edited_df.columns:
+                        date_columns["AppliedDate"] = edited_df["AppliedDate"].dt.strftime('%m/%d/%Y')
                 except Exception as e:
                     st_obj.warning(f"Could not format date columns for saving: {str(e)}")
+                save_df = edited_df.assign(**date_columns)
                 
                 save_result = AppController.save_dataframe("OtherExpenses", save_df)
                 if save_result:
@@ -122,17 +154,17 @@ def render_other_expenses_tab(st_obj):
     with col1:
         start_date = st_obj.date_input(
             "Start Date",
-            value=pd.to_datetime("01/01/2025").date(),
-            min_value=date(2020, 1, 1),
-            max_value=date(2050, 12, 31),
+            value=DEFAULT_START_DATE,
+            min_value=MIN_DATE,
+            max_value=MAX_DATE,
             key="other_expenses_start_date"
         )
     with col2:
         end_date = st_obj.date_input(
             "End Date",
-            value=pd.to_datetime("12/31/2029").date(),
-            min_value=date(2020, 1, 1),
-            max_value=date(2050, 12, 31),
+            value=DEFAULT_END_DATE,
+            min_value=MIN_DATE,
+            max_value=MAX_DATE,
             key="other_expenses_end_date"
         )
     
@@ -149,11 +181,7 @@ def render_other_expenses_tab(st_obj):
                     end_date_str = end_date.strftime("%m/%d/%Y")
                     
                     # Calculate other expenses
-                    results = calculate_other_expenses(
-                        other_data=other_expenses_df,
-                        start_date=start_date_str,
-                        end_date=end_date_str
-                    )
+                    results = _cached_other_expenses(other_expenses_df, start_date_str, end_date_str)
                     
                     # Store results
                     AppController.store_calculation_result("other_expenses", results)
@@ -180,6 +208,7 @@ def render_other_expenses_results(st_obj, results, other_expenses_df, start_date
     # Extract results
     annual_items = results.get('annual_items', pd.DataFrame())
     category_data = results.get('by_category', pd.DataFrame())
+    category_split = results.get('by_category_sorted', {})
     summary = results.get('summary', {})
     
     if annual_items.empty:
@@ -196,6 +225,12 @@ def render_other_expenses_results(st_obj, results, other_expenses_df, start_date
     with col3:
         st_obj.metric("Net Total", f"${summary.get('Net_Total', 0):,.2f}")
     
+    # Aggregate the items by month into Expense/Revenue columns once; the yearly
+    # and timeline views are both derived from this smaller table
+    monthly_by_category = annual_items.pivot_table(
+        index=['Year', 'Month'], columns='Category', values='Amount', aggfunc='sum', fill_value=0
+    ).reindex(columns=['Expense', 'Revenue'], fill_value=0)
+    
     # Create tabs for different visualizations
     viz_tabs = st_obj.tabs(["By Category", "By Year", "Expense vs Revenue", "Raw Data"])
     
@@ -213,51 +248,33 @@ def render_other_expenses_results(st_obj, results, other_expenses_df, start_date
             # Create bar chart
             by_category_totals.plot(kind='bar', ax=ax, color=['#FF6B6B', '#4ECB71'])
             
-            for i, value in enumerate(by_category_totals):
-                ax.text(i, value * 1.01, f'${value:,.0f}', ha='center')
+            ax.bar_label(ax.containers[0], fmt='${:,.0f}')
             
             ax.set_title('Total Expenses vs Revenue')
             ax.set_ylabel('Amount ($)')
             ax.grid(axis='y', linestyle='--', alpha=0.7)
-            plt.tight_layout()
+            fig.tight_layout()
             
             st_obj.pyplot(fig)
+            plt.close(fig)
             
             # Now show breakdown by title within each category
             st_obj.subheader("Breakdown by Title")
             
-            # Separate expenses and revenue for detailed visualizations
-            expenses_df = category_data[category_data['Category'] == 'Expense']
-            revenue_df = category_data[category_data['Category'] == 'Revenue']
+            # Expenses and revenue come pre-sorted by amount from the calculator
+            expenses_df = category_split.get('Expense', pd.DataFrame())
+            revenue_df = category_split.get('Revenue', pd.DataFrame())
             
             # Create visualization for expenses if there are any
             if not expenses_df.empty:
                 st_obj.write("##### Expenses Breakdown")
-                fig1, ax1 = plt.subplots(figsize=(12, 6))
-                
-                # Sort by amount descending
-                expenses_df = expenses_df.sort_values('Amount', ascending=False)
-                
-                # Create horizontal bar chart
-                bars = ax1.barh(expenses_df['Title'], expenses_df['Amount'], color='#FF6B6B')
-                
-                # Add amount labels
-                for bar in bars:
-                    width = bar.get_width()
-                    ax1.text(width * 1.01, bar.get_y() + bar.get_height()/2, 
-                           f'${width:,.0f}', va='center')
-                
-                ax1.set_title('Expenses by Title')
-                ax1.set_xlabel('Amount ($)')
-                ax1.grid(axis='x', linestyle='--', alpha=0.7)
-                plt.tight_layout()
-                
-                st_obj.pyplot(fig1)
+                st_obj.image(
+                    _render_title_bars(expenses_df, 'Expenses by Title', '#FF6B6B'),
+                    use_container_width=True
+                )
                 
                 # Display as table
-                display_expenses = expenses_df.copy()
-                display_expenses['Amount'] = display_expenses['Amount'].map('${:,.2f}'.format)
-                st_obj.dataframe(display_expenses, use_container_width=True)
+                st_obj.dataframe(expenses_df.style.format('${:,.2f}', subset=['Amount']), use_container_width=True)
             
             # Create visualization for revenue if there are any
             if not revenue_df.empty:
@@ -265,31 +282,13 @@ def render_other_expenses_results(st_obj, results, other_expenses_df, start_date
                 
                 # Check if required columns exist
                 if 'Title' in revenue_df.columns and 'Amount' in revenue_df.columns:
-                    fig2, ax2 = plt.subplots(figsize=(12, 6))
-                    
-                    # Sort by amount descending
-                    revenue_df = revenue_df.sort_values('Amount', ascending=False)
-                    
-                    # Create horizontal bar chart
-                    bars = ax2.barh(revenue_df['Title'], revenue_df['Amount'], color='#4ECB71')
-                    
-                    # Add amount labels
-                    for bar in bars:
-                        width = bar.get_width()
-                        ax2.text(width * 1.01, bar.get_y() + bar.get_height()/2, 
-                               f'${width:,.0f}', va='center')
-                    
-                    ax2.set_title('Revenue by Title')
-                    ax2.set_xlabel('Amount ($)')
-                    ax2.grid(axis='x', linestyle='--', alpha=0.7)
-                    plt.tight_layout()
-                    
-                    st_obj.pyplot(fig2)
+                    st_obj.image(
+                        _render_title_bars(revenue_df, 'Revenue by Title', '#4ECB71'),
+                        use_container_width=True
+                    )
                     
                     # Display as table
-                    display_revenue = revenue_df.copy()
-                    display_revenue['Amount'] = display_revenue['Amount'].map('${:,.2f}'.format)
-                    st_obj.dataframe(display_revenue, use_container_width=True)
+                    st_obj.dataframe(revenue_df.style.format('${:,.2f}', subset=['Amount']), use_container_width=True)
                 else:
                     st_obj.warning("Cannot create revenue visualization: missing required columns (Title and/or Amount)")
                     st_obj.write("Available columns:", list(revenue_df.columns))
@@ -303,14 +302,8 @@ def render_other_expenses_results(st_obj, results, other_expenses_df, start_date
         st_obj.subheader("Expenses and Revenue by Year")
         
         if not annual_items.empty:
-            # Group data by year and category
-            yearly_data = annual_items.groupby(['Year', 'Category'])['Amount'].sum().unstack()
-            
-            # Handle if either Expense or Revenue columns are missing
-            if 'Expense' not in yearly_data.columns:
-                yearly_data['Expense'] = 0
-            if 'Revenue' not in yearly_data.columns:
-                yearly_data['Revenue'] = 0
+            # Sum the monthly Expense/Revenue columns by year
+            yearly_data = monthly_by_category.groupby(level='Year').sum()
             
             # Create visualization
             fig, ax = plt.subplots(figsize=(12, 6))
@@ -318,27 +311,26 @@ def render_other_expenses_results(st_obj, results, other_expenses_df, start_date
             # Plot bars
             yearly_data.plot(kind='bar', ax=ax, color=['#FF6B6B', '#4ECB71'])
             
-            # Add data labels
-            for i, year_data in enumerate(yearly_data.iterrows()):
-                year, amounts = year_data
-                for j, amount in enumerate(amounts):
-                    if amount > 0:  # Only add labels to non-zero amounts
-                        ax.text(i + (j * 0.2 - 0.1), amount * 1.01, f'${amount:,.0f}', 
-                               ha='center', va='bottom', rotation=0, fontsize=8)
+            # Add data labels, only to non-zero amounts
+            for container in ax.containers:
+                ax.bar_label(
+                    container,
+                    labels=[f'${amount:,.0f}' if amount > 0 else '' for amount in container.datavalues],
+                    fontsize=8
+                )
             
             ax.set_title('Expenses and Revenue by Year')
             ax.set_ylabel('Amount ($)')
             ax.grid(axis='y', linestyle='--', alpha=0.7)
-            plt.tight_layout()
+            fig.tight_layout()
             
             st_obj.pyplot(fig)
+            plt.close(fig)
             
             # Display as table
             display_yearly = yearly_data.reset_index()
-            for col in display_yearly.columns:
-                if col != 'Year':
-                    display_yearly[col] = display_yearly[col].map('${:,.2f}'.format)
-            st_obj.dataframe(display_yearly, use_container_width=True)
+            money_cols = [col for col in display_yearly.columns if col != 'Year']
+            st_obj.dataframe(display_yearly.style.format('${:,.2f}', subset=money_cols), use_container_width=True)
         else:
             st_obj.warning("No data available for the selected date range.")
     
@@ -347,26 +339,18 @@ def render_other_expenses_results(st_obj, results, other_expenses_df, start_date
         st_obj.subheader("Expense vs Revenue Timeline")
         
         if not annual_items.empty:
-            # Group by year, month, and category
-            timeline_data = annual_items.groupby(['Year', 'Month', 'Category'])['Amount'].sum().unstack().reset_index()
+            # One row per month with Expense and Revenue columns
+            timeline_data = monthly_by_category.reset_index()
             
             # Create a date column for better plotting
-            timeline_data['Date'] = pd.to_datetime(
-                timeline_data['Year'].astype(str) + '-' + 
-                timeline_data['Month'].astype(str) + '-01'
-            )
+            timeline_data['Date'] = month_start_dates(timeline_data['Year'], timeline_data['Month'])
             
             # Sort by date
-            timeline_data = timeline_data.sort_values('Date')
-            
-            # Handle if either Expense or Revenue columns are missing
-            if 'Expense' not in timeline_data.columns:
-                timeline_data['Expense'] = 0
-            if 'Revenue' not in timeline_data.columns:
-                timeline_data['Revenue'] = 0
+            if not timeline_data['Date'].is_monotonic_increasing:
+                timeline_data = timeline_data.sort_values('Date')
             
             # Calculate net value
-            timeline_data['Net'] = timeline_data['Revenue'] - timeline_data['Expense']
+            timeline_data['Net'] = timeline_data['Revenue'].to_numpy() - timeline_data['Expense'].to_numpy()
             
             # Create visualization
             fig, ax = plt.subplots(figsize=(14, 7))
@@ -388,22 +372,22 @@ def render_other_expenses_results(st_obj, results, other_expenses_df, start_date
             ax.legend(['Expenses', 'Revenue', 'Net'])
             
             # Format y-axis with dollar signs
-            formatter = mticker.FuncFormatter(lambda x, p: f"${x:,.0f}")
-            ax.yaxis.set_major_formatter(formatter)
+            ax.yaxis.set_major_formatter(CURRENCY_FORMATTER)
             
             # Rotate x-axis labels for better readability
-            plt.xticks(rotation=45)
-            plt.tight_layout()
+            ax.tick_params(axis='x', labelrotation=45)
+            fig.tight_layout()
             
             st_obj.pyplot(fig)
+            plt.close(fig)
             
             # Display as table
-            display_timeline = timeline_data.copy()
-            display_timeline['Date'] = display_timeline['Date'].dt.strftime('%b %Y')
-            for col in ['Expense', 'Revenue', 'Net']:
-                display_timeline[col] = display_timeline[col].map('${:,.2f}'.format)
-            display_timeline = display_timeline.drop(['Year', 'Month'], axis=1)
-            st_obj.dataframe(display_timeline, use_container_width=True)
+            display_timeline = timeline_data.drop(['Year', 'Month'], axis=1)
+            st_obj.dataframe(
+                display_timeline.style.format('${:,.2f}', subset=['Expense', 'Revenue', 'Net'])
+                                      .format(lambda d: d.strftime('%b %Y'), subset=['Date']),
+                use_container_width=True
+            )
         else:
             st_obj.warning("No data available for the selected date range.")
     
@@ -415,20 +399,19 @@ def render_other_expenses_results(st_obj, results, other_expenses_df, start_date
             # Format the data for display
             display_data = annual_items.copy()
             
-            # Format amount column
-            display_data['Amount'] = display_data['Amount'].map('${:,.2f}'.format)
-            
             # Add a formatted date column
             if 'Year' in display_data.columns and 'Month' in display_data.columns:
-                display_data['Date'] = pd.to_datetime(
-                    display_data['Year'].astype(str) + '-' + 
-                    display_data['Month'].astype(str) + '-01'
-                ).dt.strftime('%b %Y')
+                display_data['Date'] = month_start_dates(
+                    display_data['Year'], display_data['Month']
+                ).strftime('%b %Y')
             
             # Reorder columns for better display
             column_order = ['Title', 'Vendor', 'Date', 'Year', 'Month', 'Amount', 'Category', 'Description']
             display_columns = [col for col in column_order if col in display_data.columns]
             
-            st_obj.dataframe(display_data[display_columns], use_container_width=True)
+            st_obj.dataframe(
+                display_data[display_columns].style.format('${:,.2f}', subset=['Amount']),
+                use_container_width=True
+            )
         else:
             st_obj.warning("No data available for the selected date range.") 
\ No newline at end of file
@@ -7,13 +7,24 @@ This module contains the UI components and logic for the Personnel tab.
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
 from typing import Dict, List, Tuple, Any, Optional
-from datetime import date
 
 from app_controller import AppController
 from financeModels.personnel_expenses import PersonnelExpenseCalculator, calculate_personnel_expenses
-from visualization import setup_plot_style, format_currency
+from visualization import (
+    setup_plot_style, format_currency, get_session_figure,
+    data_fingerprint, get_cached_plot_png, cache_plot_png, month_start_dates, CURRENCY_FORMATTER
+)
+from ui.constants import DEFAULT_START_DATE, DEFAULT_END_DATE, MIN_DATE, MAX_DATE
+
+@st.cache_data(show_spinner=False)
+def _cached_personnel_expenses(personnel_data: pd.DataFrame, start_date: str, end_date: str) -> Dict:
+    """Calculate personnel expenses, reusing results for unchanged inputs."""
+    return calculate_personnel_expenses(
+        personnel_data=personnel_data,
+        start_date=start_date,
+        end_date=end_date
+    )
 
 def render_personnel_tab(st_obj):
     """
@@ -112,15 +123,15 @@ def render_personnel_tab(st_obj):
                 "Start Date",
                 help="Start date for this personnel",
                 format="MM/DD/YYYY",
-                min_value=date(2020, 1, 1),
-                max_value=date(2050, 12, 31)
+                min_value=MIN_DATE,
+                max_value=MAX_DATE
             ),
             "EndDate": st_obj.column_config.DateColumn(
                 "End Date (Optional)",
                 help="End date for this personnel (leave blank for no end date)",
                 format="MM/DD/YYYY",
-                min_value=date(2020, 1, 1),
-                max_value=date(2050, 12, 31)
+                min_value=MIN_DATE,
+                max_value=MAX_DATE
             ),
             "Notes": st_obj.column_config.TextColumn(
                 "Notes",
@@ -134,18 +145,18 @@ def render_personnel_tab(st_obj):
         col1, col2 = st_obj.columns([1, 5])
         with col1:
             if st_obj.button("Save Personnel Data"):
-                # Convert datetime objects back to string format before saving
-                save_df = edited_df.copy()
+                # Convert datetime objects back to string format before saving,
+                # replacing only the date columns instead of copying the frame
+                date_columns = {}
                 try:
-                    if "StartDate" in save_df.columns:
-                        save_df["StartDate"] = save_df["StartDate"].dt.strftime('%m/%d/%Y')
-                    if "EndDate" in save_df.columns:
+                    if "StartDate" in edited_df.columns:
+                        date_columns["StartDate"] = edited_df["StartDate"].dt.strftime('%m/%d/%Y')
+                    if "EndDate" in edited_df.columns:
                         # Handle NaT values (empty dates)
-                        save_df["EndDate"] = save_df["EndDate"].apply(
-                            lambda x: x.strftime('%m/%d/%Y') if pd.notna(x) else ""
-                        )
+                        date_columns["EndDate"] = edited_df["EndDate"].dt.strftime('%m/%d/%Y').fillna("")
                 except Exception as e:
                     st_obj.warning(f"Could not format date columns for saving: {str(e)}")
+                save_df = edited_df.assign(**date_columns)
                 
                 save_result = AppController.save_dataframe("Personnel", save_df)
                 if save_result:
@@ -163,17 +174,17 @@ def render_personnel_tab(st_obj):
     with col1:
         start_date = st_obj.date_input(
             "Start Date", 
-            value=pd.to_datetime("01/01/2025").date(),
-            min_value=date(2020, 1, 1),
-            max_value=date(2050, 12, 31),
+            value=DEFAULT_START_DATE,
+            min_value=MIN_DATE,
+            max_value=MAX_DATE,
             key="personnel_start_date"
         )
     with col2:
         end_date = st_obj.date_input(
             "End Date", 
-            value=pd.to_datetime("12/31/2029").date(),
-            min_value=date(2020, 1, 1),
-            max_value=date(2050, 12, 31),
+            value=DEFAULT_END_DATE,
+            min_value=MIN_DATE,
+            max_value=MAX_DATE,
             key="personnel_end_date"
         )
     
@@ -190,7 +201,7 @@ def render_personnel_tab(st_obj):
                     end_date_str = end_date.strftime("%m/%d/%Y")
                     
                     # Calculate personnel expenses
-                    results = calculate_personnel_expenses(
+                    results = _cached_personnel_expenses(
                         personnel_data=personnel_df,
                         start_date=start_date_str,
                         end_date=end_date_str
@@ -206,6 +217,8 @@ def render_personnel_tab(st_obj):
                 import traceback
                 st_obj.error(f"Error calculating personnel expenses: {str(e)}")
                 st_obj.error(traceback.format_exc())
+                # Release any pyplot figures left open by the failed render
+                plt.close('all')
 
 def render_personnel_results(st_obj, results, personnel_df, start_date, end_date):
     """
@@ -222,87 +235,80 @@ def render_personnel_results(st_obj, results, personnel_df, start_date, end_date
     st_obj.subheader("Total Personnel Expenses by Year")
     annual_df = results['annual']
     
-    fig1, ax1 = plt.subplots(figsize=(12, 6))
     annual_totals = annual_df.groupby('Year')['Total_Expense'].sum()
-    annual_totals.plot(kind='bar', color='skyblue', ax=ax1)
-    ax1.set_title('Total Personnel Expenses by Year')
-    ax1.set_xlabel('Year')
-    ax1.set_ylabel('Total Expense ($)')
-    ax1.grid(axis='y', linestyle='--', alpha=0.7)
-    ax1.tick_params(axis='x', rotation=0)
     
     # Format y-axis with dollar signs
-    fmt = '${x:,.0f}'
-    tick = mticker.StrMethodFormatter(fmt)
-    ax1.yaxis.set_major_formatter(tick)
+    tick = CURRENCY_FORMATTER
+    
+    # Plots are only redrawn when the data behind them changes
+    fingerprint1 = data_fingerprint(annual_totals)
+    png1 = get_cached_plot_png('personnel_fig1_png', fingerprint1)
+    if png1 is None:
+        fig1, ax1 = get_session_figure('personnel_fig1', figsize=(12, 6))
+        annual_totals.plot(kind='bar', color='skyblue', ax=ax1)
+        ax1.set_title('Total Personnel Expenses by Year')
+        ax1.set_xlabel('Year')
+        ax1.set_ylabel('Total Expense ($)')
+        ax1.grid(axis='y', linestyle='--', alpha=0.7)
+        ax1.tick_params(axis='x', rotation=0)
+        ax1.yaxis.set_major_formatter(tick)
+        png1 = cache_plot_png('personnel_fig1_png', fingerprint1, fig1)
     
-    st_obj.pyplot(fig1)
+    st_obj.image(png1, use_container_width=True)
     
     # Display summary of annual expenses as a dataframe
     annual_table = annual_totals.reset_index()
-    annual_table['Total_Expense'] = annual_table['Total_Expense'].map('${:,.2f}'.format)
     annual_table.columns = ['Year', 'Total Expense']
-    st_obj.dataframe(annual_table, use_container_width=True)
+    st_obj.dataframe(annual_table.style.format({'Total Expense': '${:,.2f}'}), use_container_width=True)
     
     # Display visualization 2: Expenses by institution and type
     st_obj.subheader("Personnel Expenses by Institution and Type")
     category_df = results['by_category']
     
-    fig2, ax2 = plt.subplots(figsize=(14, 7))
-    pivot_df = category_df.pivot_table(
-        index='Institution', 
-        columns='Type', 
-        values='Total_Expense',
-        aggfunc='sum',
-        fill_value=0
-    )
-    pivot_df.plot(kind='bar', stacked=True, colormap='viridis', ax=ax2)
-    ax2.set_title('Personnel Expenses by Institution and Type')
-    ax2.set_xlabel('Institution')
-    ax2.set_ylabel('Total Expense ($)')
-    ax2.grid(axis='y', linestyle='--', alpha=0.7)
-    ax2.tick_params(axis='x', rotation=45)
-    ax2.legend(title='Staff Type')
+    pivot_df = category_df.groupby(['Institution', 'Type'])['Total_Expense'].sum().unstack(fill_value=0)
     
-    # Format y-axis with dollar signs
-    ax2.yaxis.set_major_formatter(tick)
+    fingerprint2 = data_fingerprint(pivot_df)
+    png2 = get_cached_plot_png('personnel_fig2_png', fingerprint2)
+    if png2 is None:
+        fig2, ax2 = get_session_figure('personnel_fig2', figsize=(14, 7))
+        pivot_df.plot(kind='bar', stacked=True, colormap='viridis', ax=ax2)
+        ax2.set_title('Personnel Expenses by Institution and Type')
+        ax2.set_xlabel('Institution')
+        ax2.set_ylabel('Total Expense ($)')
+        ax2.grid(axis='y', linestyle='--', alpha=0.7)
+        ax2.tick_params(axis='x', rotation=45)
+        ax2.legend(title='Staff Type')
+        ax2.yaxis.set_major_formatter(tick)
+        png2 = cache_plot_png('personnel_fig2_png', fingerprint2, fig2)
     
-    st_obj.pyplot(fig2)
+    st_obj.image(png2, use_container_width=True)
     
     # Display summary of category expenses
-    display_category = category_df.copy()
-    # Format currency columns
-    for col in ['Base_Expense', 'Fringe_Amount', 'Total_Expense']:
-        if col in display_category.columns:
-            display_category[col] = display_category[col].map('${:,.2f}'.format)
-    
-    st_obj.dataframe(display_category, use_container_width=True)
+    money_cols = [col for col in ['Base_Expense', 'Fringe_Amount', 'Total_Expense'] if col in category_df.columns]
+    st_obj.dataframe(category_df.style.format('${:,.2f}', subset=money_cols), use_container_width=True)
     
     # Display visualization 3: Headcount over time
     st_obj.subheader("FTE Count Over Time by Staff Type")
     headcount_df = results['headcount']
     
     # Create a date column for better plotting
-    headcount_df['Date'] = pd.to_datetime(
-        headcount_df['Year'].astype(str) + '-' + 
-        headcount_df['Month'].astype(str) + '-01'
-    )
+    headcount_df['Date'] = month_start_dates(headcount_df['Year'], headcount_df['Month'])
     
-    fig3, ax3 = plt.subplots(figsize=(14, 6))
-    headcount_pivoted = headcount_df.pivot_table(
-        index='Date', 
-        columns='Type', 
-        values='FTE_Count',
-        aggfunc='sum',
-        fill_value=0
-    )
-    headcount_pivoted.plot(kind='area', stacked=True, alpha=0.7, colormap='tab10', ax=ax3)
-    ax3.set_title('FTE Count Over Time by Staff Type')
-    ax3.set_xlabel('Date')
-    ax3.set_ylabel('FTE Count')
-    ax3.grid(linestyle='--', alpha=0.7)
-    ax3.legend(title='Staff Type')
-    st_obj.pyplot(fig3)
+    headcount_pivoted = headcount_df.groupby(['Date', 'Type'])['FTE_Count'].sum().unstack(fill_value=0)
+    
+    fingerprint3 = data_fingerprint(headcount_pivoted)
+    png3 = get_cached_plot_png('personnel_fig3_png', fingerprint3)
+    if png3 is None:
+        fig3, ax3 = get_session_figure('personnel_fig3', figsize=(14, 6))
+        headcount_pivoted.plot(kind='area', stacked=True, alpha=0.7, colormap='tab10', ax=ax3)
+        ax3.set_title('FTE Count Over Time by Staff Type')
+        ax3.set_xlabel('Date')
+        ax3.set_ylabel('FTE Count')
+        ax3.grid(linestyle='--', alpha=0.7)
+        ax3.legend(title='Staff Type')
+        png3 = cache_plot_png('personnel_fig3_png', fingerprint3, fig3)
+    
+    st_obj.image(png3, use_container_width=True)
     
     # Display grand total
     st_obj.subheader("Grand Total")
@@ -318,10 +324,10 @@ def render_personnel_results(st_obj, results, personnel_df, start_date, end_date
         st_obj.metric("Total Expense", f"${grand_total['Total_Expense']:,.2f}")
     
     # Display as a table as well
-    formatted_grand_total = {
-        'Base Expense': f"${grand_total['Base_Expense']:,.2f}",
-        'Fringe Amount': f"${grand_total['Fringe_Amount']:,.2f}",
-        'Total Expense': f"${grand_total['Total_Expense']:,.2f}"
-    }
+    grand_total_df = pd.DataFrame([{
+        'Base Expense': grand_total['Base_Expense'],
+        'Fringe Amount': grand_total['Fringe_Amount'],
+        'Total Expense': grand_total['Total_Expense']
+    }])
     
-    st_obj.table(pd.DataFrame([formatted_grand_total])) 
\ No newline at end of file
+    st_obj.table(grand_total_df.style.format('${:,.2f}')) 
\ No newline at end of file
@@ -8,17 +8,16 @@ which provides an overview of the financial data from various sources.
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
+import altair as alt
 from typing import Dict, List, Tuple, Any, Optional
-from datetime import date
 
 from app_controller import AppController
 from financeModels.equipment_expenses import calculate_equipment_expenses
 from financeModels.personnel_expenses import calculate_personnel_expenses
 from financeModels.exam_revenue import calculate_exam_revenue, ExamRevenueCalculator
 from financeModels.other_expenses import calculate_other_expenses
-from visualization import setup_plot_style, format_currency
+from visualization import setup_plot_style, format_currency, get_session_figure, CURRENCY_FORMATTER
+from ui.constants import DEFAULT_START_DATE, DEFAULT_END_DATE, MIN_DATE, MAX_DATE
 
 def render_plots_tab(st_obj):
     """
@@ -41,17 +40,17 @@ def render_plots_tab(st_obj):
     with col1:
         start_date = st_obj.date_input(
             "Start Date",
-            value=pd.to_datetime("01/01/2025").date(),
-            min_value=date(2020, 1, 1),
-            max_value=date(2050, 12, 31),
+            value=DEFAULT_START_DATE,
+            min_value=MIN_DATE,
+            max_value=MAX_DATE,
             key="summary_start_date"
         )
     with col2:
         end_date = st_obj.date_input(
             "End Date",
-            value=pd.to_datetime("12/31/2029").date(),
-            min_value=date(2020, 1, 1),
-            max_value=date(2050, 12, 31),
+            value=DEFAULT_END_DATE,
+            min_value=MIN_DATE,
+            max_value=MAX_DATE,
             key="summary_end_date"
         )
     
@@ -169,7 +168,7 @@ def generate_summary_data(st_obj, start_date: str, end_date: str) -> Dict:
             # We don't know which sources to include, so include all
             revenue_sources = None
             if revenue_df is not None and 'Title' in revenue_df.columns:
-                revenue_sources = revenue_df['Title'].tolist()
+                revenue_sources = AppController.get_revenue_sources(revenue_df)
             
             # Calculate exam revenue
             exam_results = calculator.calculate_multi_year_exam_revenue(
@@ -354,11 +353,10 @@ def generate_annual_summary(results: Dict, start_date: str, end_date: str) -> pd
         exam_annual = results['exam_revenue']['annual_summary']
         if isinstance(exam_annual, pd.DataFrame) and not exam_annual.empty:
             if 'Year' in exam_annual.columns and 'Total_Revenue' in exam_annual.columns:
-                for idx, row in exam_annual.iterrows():
-                    year = row['Year']
+                for year, exam_revenue in zip(exam_annual['Year'], exam_annual['Total_Revenue']):
                     if year in years:
                         idx = years.index(year)
-                        annual_summary.loc[idx, 'Revenue'] += row['Total_Revenue']
+                        annual_summary.loc[idx, 'Revenue'] += exam_revenue
     
     # Add other revenue items if available
     if ('other_expenses' in results and 
@@ -516,7 +514,7 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
         with viz_tabs[0]:
             st_obj.subheader("Revenue vs Expenses by Year")
             
-            fig1, ax1 = plt.subplots(figsize=(12, 7))
+            fig1, ax1 = get_session_figure('summary_revenue_expenses_fig', figsize=(12, 7))
             
             # Create bar chart of revenue vs expenses
             x = annual_summary['Year'].tolist()  # Convert to list to avoid Series issues
@@ -529,18 +527,10 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
             bars1 = ax1.bar(x_pos - bar_width/2, revenue, bar_width, label='Revenue', color='#4ECB71')
             bars2 = ax1.bar(x_pos + bar_width/2, expenses, bar_width, label='Expenses', color='#FF6B6B')
             
-            # Add data labels
-            for bar in bars1:
-                height = bar.get_height()
-                if height > 0:
-                    ax1.text(bar.get_x() + bar.get_width()/2., height + 5000,
-                           f"${height:,.0f}", ha='center', va='bottom', rotation=0, fontsize=9)
-            
-            for bar in bars2:
-                height = bar.get_height()
-                if height > 0:
-                    ax1.text(bar.get_x() + bar.get_width()/2., height + 5000,
-                           f"${height:,.0f}", ha='center', va='bottom', rotation=0, fontsize=9)
+            # Add data labels, leaving empty bars unlabeled
+            for bars, values in ((bars1, revenue), (bars2, expenses)):
+                labels = [f"${v:,.0f}" if v > 0 else '' for v in values]
+                ax1.bar_label(bars, labels=labels, padding=3, fontsize=9)
             
             ax1.set_xlabel('Year')
             ax1.set_ylabel('Amount ($)')
@@ -551,31 +541,30 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
             ax1.legend()
             
             # Format y-axis with dollar signs
-            formatter = mticker.FuncFormatter(lambda x, p: f"${x:,.0f}")
-            ax1.yaxis.set_major_formatter(formatter)
+            ax1.yaxis.set_major_formatter(CURRENCY_FORMATTER)
             
-            plt.tight_layout()
+            fig1.tight_layout()
             st_obj.pyplot(fig1)
         
         # Expense Breakdown Visualization
         with viz_tabs[1]:
             st_obj.subheader("Expense Breakdown by Year")
             
-            fig2, ax2 = plt.subplots(figsize=(12, 7))
+            fig2, ax2 = get_session_figure('summary_expense_breakdown_fig', figsize=(12, 7))
             
-            # Create stacked bar chart of expenses
+            # Create stacked bar chart of expenses; one (year x category) array gives
+            # both the stack offsets and the category totals for the pie chart below
             x = annual_summary['Year'].tolist()  # Convert to list
-            personnel = annual_summary['Personnel_Expenses'].tolist()  # Convert to list
-            equipment = annual_summary['Equipment_Expenses'].tolist()  # Convert to list
-            other = annual_summary['Other_Expenses'].tolist()  # Convert to list
+            expense_matrix = annual_summary[['Personnel_Expenses', 'Equipment_Expenses', 'Other_Expenses']].to_numpy(dtype=float)
+            stack_bottoms = np.zeros_like(expense_matrix)
+            stack_bottoms[:, 1:] = np.cumsum(expense_matrix[:, :-1], axis=1)
             
             bar_width = 0.6
             x_pos = np.arange(len(x))
             
             # Create stacked bars
-            bars1 = ax2.bar(x_pos, personnel, bar_width, label='Personnel', color='#5DA5DA')
-            bars2 = ax2.bar(x_pos, equipment, bar_width, bottom=personnel, label='Equipment', color='#FAA43A')
-            bars3 = ax2.bar(x_pos, other, bar_width, bottom=[p+e for p,e in zip(personnel, equipment)], label='Other', color='#60BD68')
+            for column, (label, color) in enumerate([('Personnel', '#5DA5DA'), ('Equipment', '#FAA43A'), ('Other', '#60BD68')]):
+                ax2.bar(x_pos, expense_matrix[:, column], bar_width, bottom=stack_bottoms[:, column], label=label, color=color)
             
             ax2.set_xlabel('Year')
             ax2.set_ylabel('Amount ($)')
@@ -586,31 +575,33 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
             ax2.legend()
             
             # Format y-axis with dollar signs
-            formatter = mticker.FuncFormatter(lambda x, p: f"${x:,.0f}")
-            ax2.yaxis.set_major_formatter(formatter)
+            ax2.yaxis.set_major_formatter(CURRENCY_FORMATTER)
             
-            plt.tight_layout()
+            fig2.tight_layout()
             st_obj.pyplot(fig2)
             
             # Also show as a pie chart for total expenses
             st_obj.subheader("Total Expense Distribution")
             
-            total_personnel = sum(personnel)
-            total_equipment = sum(equipment)
-            total_other = sum(other)
+            expense_values = expense_matrix.sum(axis=0)
+            expense_types = np.array(['Personnel', 'Equipment', 'Other'])
+            colors = np.array(['#5DA5DA', '#FAA43A', '#60BD68'])
             
-            if total_personnel > 0 or total_equipment > 0 or total_other > 0:
-                fig3, ax3 = plt.subplots(figsize=(8, 8))
+            # Only build the figure when there is something to draw, and leave
+            # out empty slices
+            non_zero = expense_values > 0
+            if non_zero.any():
+                fig3, ax3 = get_session_figure('summary_expense_pie_fig', figsize=(8, 8))
                 
                 # Create pie chart
-                expense_types = ['Personnel', 'Equipment', 'Other']
-                expense_values = [total_personnel, total_equipment, total_other]
-                colors = ['#5DA5DA', '#FAA43A', '#60BD68']
+                expense_values = expense_values[non_zero]
+                expense_types = expense_types[non_zero]
+                colors = colors[non_zero]
                 
                 # Add percentage and value labels
                 def autopct_format(values):
+                    total = values.sum()
                     def my_format(pct):
-                        total = sum(values)
                         val = int(round(pct*total/100.0))
                         return f'{pct:.1f}%\n(${val:,.0f})'
                     return my_format
@@ -629,7 +620,7 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
                     text.set_fontsize(9)
                 
                 ax3.set_title('Distribution of Total Expenses')
-                plt.tight_layout()
+                fig3.tight_layout()
                 st_obj.pyplot(fig3)
             else:
                 st_obj.info("No expense data available to create distribution chart.")
@@ -638,23 +629,18 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
         with viz_tabs[2]:
             st_obj.subheader("Net Income by Year")
             
-            fig4, ax4 = plt.subplots(figsize=(12, 7))
+            fig4, ax4 = get_session_figure('summary_net_income_fig', figsize=(12, 7))
             
             # Create bar chart for net income
             x = annual_summary['Year'].tolist()  # Convert to list
             net_income_by_year = annual_summary['Net_Income'].tolist()  # Convert to list
             
-            bars = ax4.bar(x, net_income_by_year, color=['#4ECB71' if val >= 0 else '#FF6B6B' for val in net_income_by_year])
+            # Green for profitable years, red for losses
+            bar_colors = np.where(annual_summary['Net_Income'].to_numpy() >= 0, '#4ECB71', '#FF6B6B')
+            bars = ax4.bar(x, net_income_by_year, color=bar_colors)
             
-            # Add data labels
-            for bar in bars:
-                height = bar.get_height()
-                if height >= 0:
-                    ax4.text(bar.get_x() + bar.get_width()/2., height + 5000,
-                           f"${height:,.0f}", ha='center', va='bottom', rotation=0, fontsize=9)
-                else:
-                    ax4.text(bar.get_x() + bar.get_width()/2., height - 20000,
-                           f"${height:,.0f}", ha='center', va='top', rotation=0, fontsize=9)
+            # Add data labels (bar_label places labels of negative bars below them)
+            ax4.bar_label(bars, fmt='${:,.0f}', padding=3, fontsize=9)
             
             ax4.set_xlabel('Year')
             ax4.set_ylabel('Amount ($)')
@@ -665,19 +651,18 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
             ax4.axhline(y=0, color='black', linestyle='-', alpha=0.3)
             
             # Format y-axis with dollar signs
-            formatter = mticker.FuncFormatter(lambda x, p: f"${x:,.0f}")
-            ax4.yaxis.set_major_formatter(formatter)
+            ax4.yaxis.set_major_formatter(CURRENCY_FORMATTER)
             
-            plt.tight_layout()
+            fig4.tight_layout()
             st_obj.pyplot(fig4)
             
             # Add cumulative net income chart
             st_obj.subheader("Cumulative Net Income")
             
-            fig5, ax5 = plt.subplots(figsize=(12, 7))
+            fig5, ax5 = get_session_figure('summary_cumulative_net_income_fig', figsize=(12, 7))
             
             # Calculate cumulative net income
-            cumulative_net_income = [sum(net_income_by_year[:i+1]) for i in range(len(net_income_by_year))]
+            cumulative_net_income = np.cumsum(net_income_by_year)
             
             # Create line chart
             ax5.plot(x, cumulative_net_income, marker='o', linestyle='-', color='#4361EE', linewidth=2)
@@ -692,25 +677,17 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
             ax5.grid(True, linestyle='--', alpha=0.7)
             
             # Format y-axis with dollar signs
-            ax5.yaxis.set_major_formatter(formatter)
+            ax5.yaxis.set_major_formatter(CURRENCY_FORMATTER)
             
-            plt.tight_layout()
+            fig5.tight_layout()
             st_obj.pyplot(fig5)
         
         # Annual Summary Table
         with viz_tabs[3]:
             st_obj.subheader("Annual Financial Summary")
             
-            # Format the summary table for display
-            display_summary = annual_summary.copy()
-            
-            # Format currency columns - using series.apply instead of map for better compatibility
-            for col in annual_summary.columns:
-                if col != 'Year':
-                    display_summary[col] = display_summary[col].apply(lambda x: f"${x:,.2f}")
-            
             # Rename columns for better display
-            display_summary.columns = [
+            display_summary = annual_summary.set_axis([
                 'Year',
                 'Revenue',
                 'Personnel Expenses',
@@ -718,18 +695,19 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
                 'Other Expenses',
                 'Total Expenses',
                 'Net Income'
-            ]
+            ], axis=1)
             
-            st_obj.dataframe(display_summary, use_container_width=True)
+            # Currency columns are formatted at render time, keeping the values numeric
+            st_obj.dataframe(
+                display_summary.style.format('${:,.2f}', subset=list(display_summary.columns[1:])),
+                use_container_width=True
+            )
             
             # Calculate and display key financial metrics
             st_obj.subheader("Key Financial Metrics")
             
             # Calculate breakeven year
-            breakeven_years = []
-            for i, row in annual_summary.iterrows():
-                if row['Net_Income'] >= 0:
-                    breakeven_years.append(row['Year'])
+            breakeven_years = annual_summary.loc[annual_summary['Net_Income'] >= 0, 'Year'].tolist()
             
             col1, col2 = st_obj.columns(2)
             
@@ -814,124 +792,84 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
                         fill_value=0
                     )
                     
-                    # Create a DataFrame to hold year-by-year revenue line data
-                    combined_data = []
-                    
                     # Get revenue data for PctFullModel values
                     revenue_data = AppController.get_dataframe("Revenue")
                     
                     if revenue_data is not None and not revenue_data.empty and 'Title' in revenue_data.columns and 'PctFullModel' in revenue_data.columns:
                         # Create mapping of revenue source to PctFullModel
-                        pct_full_model_map = {}
-                        for _, row in revenue_data.iterrows():
-                            if 'Title' in row and 'PctFullModel' in row:
-                                pct_full_model_map[row['Title']] = row['PctFullModel']
+                        pct_full_model_map = dict(zip(revenue_data['Title'], revenue_data['PctFullModel']))
                         
                         # Calculate total PctFullModel for all sources
                         total_pct_full_model = sum(pct_full_model_map.values())
                         
-                        # For each year and revenue source, calculate shared expenses based on PctFullModel
-                        for year in years:
-                            # Get shared expenses (Personnel, Equipment, Other) for this year
-                            year_data = annual_summary[annual_summary['Year'] == year]
-                            
-                            if not year_data.empty:
-                                shared_expenses = year_data['Personnel_Expenses'].iloc[0] + year_data['Equipment_Expenses'].iloc[0] + year_data['Other_Expenses'].iloc[0]
-                                
-                                # For each revenue source, calculate its portion of shared expenses
-                                for source in sources:
-                                    # Get revenue and direct expenses for this source and year
-                                    source_revenue = revenue_pivot.loc[year, source] if year in revenue_pivot.index and source in revenue_pivot.columns else 0
-                                    source_direct_expenses = expense_pivot.loc[year, source] if year in expense_pivot.index and source in expense_pivot.columns else 0
-                                    
-                                    # Calculate shared expenses based on PctFullModel
-                                    source_pct_full_model = pct_full_model_map.get(source, 0)
-                                    source_shared_expenses = shared_expenses * (source_pct_full_model / total_pct_full_model) if total_pct_full_model > 0 else 0
-                                    
-                                    # Calculate total expenses and net income
-                                    total_expenses = source_direct_expenses + source_shared_expenses
-                                    net_income = source_revenue - total_expenses
-                                    
-                                    # Add to combined data
-                                    combined_data.append({
-                                        'Year': year,
-                                        'Revenue Source': source,
-                                        'Revenue': source_revenue,
-                                        'Direct Expenses': source_direct_expenses,
-                                        'Allocated Expenses': source_shared_expenses,
-                                        'Total Expenses': total_expenses,
-                                        'Net Income': net_income
-                                    })
+                        # Shared expenses (Personnel, Equipment, Other) for each year in the summary
+                        year_rows = annual_summary.drop_duplicates('Year').set_index('Year')
+                        shared_by_year = (year_rows['Personnel_Expenses'] + year_rows['Equipment_Expenses'] + year_rows['Other_Expenses'])
+                        years = [year for year in years if year in shared_by_year.index]
                         
-                        if combined_data:
-                            # Convert to DataFrame
-                            combined_df = pd.DataFrame(combined_data)
-                            
-                            # Add yearly totals
-                            yearly_totals = combined_df.groupby('Year').agg({
-                                'Revenue': 'sum',
-                                'Direct Expenses': 'sum',
-                                'Allocated Expenses': 'sum',
-                                'Total Expenses': 'sum',
-                                'Net Income': 'sum'
-                            }).reset_index()
-                            yearly_totals['Revenue Source'] = 'TOTAL'
-                            
-                            # Concatenate with combined data
-                            combined_df = pd.concat([combined_df, yearly_totals], ignore_index=True)
-                            
-                            # Sort by Year and then put TOTAL at the end of each year group
-                            combined_df['sort_key'] = combined_df['Revenue Source'].apply(lambda x: 1 if x == 'TOTAL' else 0)
-                            combined_df = combined_df.sort_values(['Year', 'sort_key', 'Revenue Source'])
-                            combined_df = combined_df.drop('sort_key', axis=1)
+                        # Each source's share of the shared expenses, based on PctFullModel
+                        source_pct_full_model = np.array([pct_full_model_map.get(source, 0) for source in sources], dtype=float)
+                        if total_pct_full_model > 0:
+                            source_shares = source_pct_full_model / total_pct_full_model
+                        else:
+                            source_shares = np.zeros(len(sources))
+                        
+                        # Build one row per year and revenue source (year-major, matching the pivot layout)
+                        source_revenue = revenue_pivot.reindex(index=years, columns=sources, fill_value=0).to_numpy().ravel()
+                        source_direct_expenses = expense_pivot.reindex(index=years, columns=sources, fill_value=0).to_numpy().ravel()
+                        source_shared_expenses = np.outer(shared_by_year.reindex(years).to_numpy(), source_shares).ravel()
+                        total_expenses = source_direct_expenses + source_shared_expenses
+                        
+                        combined_df = pd.DataFrame({
+                            'Year': np.repeat(years, len(sources)),
+                            'Revenue Source': np.tile(sources, len(years)),
+                            'Revenue': source_revenue,
+                            'Direct Expenses': source_direct_expenses,
+                            'Allocated Expenses': source_shared_expenses,
+                            'Total Expenses': total_expenses,
+                            'Net Income': source_revenue - total_expenses
+                        })
+                        
+                        if not combined_df.empty:
+                            # Add yearly totals. The rows are already ordered by year and then
+                            # (sorted) revenue line, so each year's TOTAL row is placed after its
+                            # lines directly instead of concatenating and re-sorting the table
+                            money_cols = ['Revenue', 'Direct Expenses', 'Allocated Expenses', 'Total Expenses', 'Net Income']
+                            line_values = combined_df[money_cols].to_numpy().reshape(len(years), len(sources), len(money_cols))
+                            table_values = np.concatenate(
+                                [line_values, line_values.sum(axis=1, keepdims=True)], axis=1
+                            ).reshape(-1, len(money_cols))
                             
-                            # Format currency columns for display
-                            display_df = combined_df.copy()
-                            for col in ['Revenue', 'Direct Expenses', 'Allocated Expenses', 'Total Expenses', 'Net Income']:
-                                display_df[col] = display_df[col].apply(lambda x: f"${x:,.2f}")
+                            table_df = pd.DataFrame(table_values, columns=money_cols)
+                            table_df.insert(0, 'Year', np.repeat(years, len(sources) + 1))
+                            table_df.insert(1, 'Revenue Source', (list(sources) + ['TOTAL']) * len(years))
                             
-                            # Display the table
-                            st_obj.dataframe(display_df, use_container_width=True)
+                            # Display the table, formatting currency columns at render time
+                            st_obj.dataframe(
+                                table_df.style.format('${:,.2f}', subset=money_cols),
+                                use_container_width=True
+                            )
                             
                             # Create a stacked bar chart of revenue by source over time
                             st_obj.subheader("Revenue by Revenue Line Over Time")
                             
-                            # Filter out TOTAL rows for the chart
-                            chart_df = combined_df[combined_df['Revenue Source'] != 'TOTAL'].copy()
-                            
-                            fig6, ax6 = plt.subplots(figsize=(12, 7))
-                            
-                            # Create pivot table for the chart
-                            revenue_chart_data = pd.pivot_table(
-                                chart_df,
-                                values='Revenue',
-                                index=['Year'],
-                                columns=['Revenue Source'],
-                                fill_value=0
-                            )
-                            
-                            # Plot stacked bar chart
-                            revenue_chart_data.plot(kind='bar', stacked=True, ax=ax6)
+                            # The per-line rows (without the TOTAL rows) feed the charts
+                            chart_df = combined_df
                             
-                            # Format axes
-                            ax6.set_xlabel('Year')
-                            ax6.set_ylabel('Revenue ($)')
-                            ax6.set_title('Revenue by Source')
-                            
-                            # Format y-axis with dollar signs
-                            formatter = mticker.FuncFormatter(lambda x, p: f"${x:,.0f}")
-                            ax6.yaxis.set_major_formatter(formatter)
-                            
-                            # Add a grid for better readability
-                            ax6.grid(axis='y', linestyle='--', alpha=0.7)
-                            
-                            plt.tight_layout()
-                            st_obj.pyplot(fig6)
+                            # Stacked bar chart rendered client-side by Vega-Lite; the long-format
+                            # rows are sent as a small spec instead of a server-rendered image
+                            revenue_chart = alt.Chart(chart_df[['Year', 'Revenue Source', 'Revenue']]).mark_bar().encode(
+                                x=alt.X('Year:O', title='Year'),
+                                y=alt.Y('Revenue:Q', title='Revenue ($)', axis=alt.Axis(format='$,.0f')),
+                                color=alt.Color('Revenue Source:N', title='Revenue Source'),
+                                tooltip=['Year:O', 'Revenue Source:N', alt.Tooltip('Revenue:Q', format='$,.0f')]
+                            ).properties(title='Revenue by Source', height=450)
+                            st_obj.altair_chart(revenue_chart, use_container_width=True)
                             
                             # Create a line chart showing net income by revenue line
                             st_obj.subheader("Net Income by Revenue Line")
                             
-                            fig7, ax7 = plt.subplots(figsize=(12, 7))
+                            fig7, ax7 = get_session_figure('summary_revenue_line_fig', figsize=(12, 7))
                             
                             # Create pivot table for net income by year and source
                             net_income_chart_data = pd.pivot_table(
@@ -951,7 +889,7 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
                             ax7.set_title('Net Income by Revenue Line')
                             
                             # Format y-axis with dollar signs
-                            ax7.yaxis.set_major_formatter(formatter)
+                            ax7.yaxis.set_major_formatter(CURRENCY_FORMATTER)
                             
                             # Add a horizontal line at y=0
                             ax7.axhline(y=0, color='black', linestyle='-', alpha=0.3)
@@ -959,7 +897,7 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
                             # Add a grid for better readability
                             ax7.grid(True, linestyle='--', alpha=0.7)
                             
-                            plt.tight_layout()
+                            fig7.tight_layout()
                             st_obj.pyplot(fig7)
                             
                             # Waterfall charts showing revenue and expenses for each revenue line by year
@@ -982,8 +920,8 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
                                         st_obj.info(f"No financial activity for {source} - all values are zero.")
                                         continue
                                     
-                                    # Create figure
-                                    fig8, ax8 = plt.subplots(figsize=(12, 7))
+                                    # Redraw on one figure shared by all revenue lines (and reruns)
+                                    fig8, ax8 = get_session_figure('summary_waterfall_fig', figsize=(12, 7))
                                     
                                     # Get data for this source
                                     years = source_data['Year'].tolist()
@@ -1014,74 +952,54 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
                                         label='Expenses'
                                     )
                                     
-                                    # Net income bars
+                                    # Net income bars, green for positive and dark red for negative
+                                    # (the same colors are reused for their labels)
+                                    net_colors = np.where(source_data['Net Income'].to_numpy() >= 0, '#006400', '#8B0000')
                                     net_bars = ax8.bar(
                                         x_positions,  # Centered
                                         net_incomes,
                                         width=bar_width*0.5,  # Thinner bars
-                                        color=['#006400' if ni >= 0 else '#8B0000' for ni in net_incomes],  # Green for positive, dark red for negative
+                                        color=net_colors,
                                         label='Net Income',
                                         zorder=3  # Ensure it's drawn on top
                                     )
                                     
-                                    # Find the maximum value to set reasonable text position limits
+                                    # Find the maximum value to set reasonable axis limits
                                     max_value = max([max(revenues or [0]), max(expenses or [0]), max([abs(n) for n in net_incomes] or [0])]) 
                                     
                                     # Handle the case where all values might be zero
                                     if max_value == 0:
                                         max_value = 1000  # Set a default non-zero value
                                     
-                                    # Set a reasonable text offset as a percentage of the max value
-                                    text_offset = max_value * 0.05  # 5% of max value
-                                    # Ensure offset is not too small
-                                    text_offset = max(text_offset, 100)
-                                    
-                                    # Add value labels on top of each bar
-                                    for i, bar in enumerate(revenue_bars):
-                                        height = bar.get_height()
-                                        if height > 0:
-                                            ax8.text(
-                                                bar.get_x() + bar.get_width()/2,
-                                                height + text_offset,  # Add fixed offset
-                                                f"${revenues[i]:,.0f}",
-                                                ha='center',
-                                                va='bottom',
-                                                color='#006400',
-                                                fontweight='bold',
-                                                fontsize=8  # Slightly smaller font
-                                            )
+                                    # Add value labels on top of each bar (zero-height bars stay unlabeled)
+                                    ax8.bar_label(
+                                        revenue_bars,
+                                        labels=[f"${r:,.0f}" if r > 0 else '' for r in revenues],
+                                        padding=3,
+                                        color='#006400',
+                                        fontweight='bold',
+                                        fontsize=8  # Slightly smaller font
+                                    )
                                     
-                                    for i, bar in enumerate(expense_bars):
-                                        height = bar.get_height()
-                                        if height > 0:
-                                            ax8.text(
-                                                bar.get_x() + bar.get_width()/2,
-                                                height + text_offset,  # Add fixed offset
-                                                f"${expenses[i]:,.0f}",
-                                                ha='center',
-                                                va='bottom',
-                                                color='#8B0000',
-                                                fontweight='bold',
-                                                fontsize=8  # Slightly smaller font
-                                            )
+                                    ax8.bar_label(
+                                        expense_bars,
+                                        labels=[f"${e:,.0f}" if e > 0 else '' for e in expenses],
+                                        padding=3,
+                                        color='#8B0000',
+                                        fontweight='bold',
+                                        fontsize=8
+                                    )
                                     
-                                    for i, bar in enumerate(net_bars):
-                                        height = bar.get_height()
-                                        if abs(height) > 0.01:  # Only label non-zero values
-                                            # Position depends on whether net income is positive or negative
-                                            va_position = 'bottom' if height >= 0 else 'top'
-                                            # Use a consistent and limited offset
-                                            text_y = height + (text_offset if height >= 0 else -text_offset)
-                                            ax8.text(
-                                                bar.get_x() + bar.get_width()/2,
-                                                text_y,
-                                                f"Net: ${net_incomes[i]:,.0f}",
-                                                ha='center',
-                                                va=va_position,
-                                                color='#006400' if net_incomes[i] >= 0 else '#8B0000',
-                                                fontweight='bold',
-                                                fontsize=8  # Slightly smaller font
-                                            )
+                                    # bar_label places labels below negative bars, matching the old va switch
+                                    net_labels = ax8.bar_label(
+                                        net_bars,
+                                        labels=[f"Net: ${ni:,.0f}" if abs(ni) > 0.01 else '' for ni in net_incomes],
+                                        padding=3,
+                                        fontweight='bold',
+                                        fontsize=8
+                                    )
+                                    for label, color in zip(net_labels, net_colors):
+                                        label.set_color(color)
                                     
                                     # Set labels and title
                                     ax8.set_xlabel('Year')
@@ -1094,8 +1012,7 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
                                     ax8.axhline(y=0, color='black', linestyle='-', alpha=0.3)
                                     
                                     # Format y-axis with dollar signs
-                                    formatter = mticker.FuncFormatter(lambda x, p: f"${x:,.0f}")
-                                    ax8.yaxis.set_major_formatter(formatter)
+                                    ax8.yaxis.set_major_formatter(CURRENCY_FORMATTER)
                                     
                                     # Add grid for better readability
                                     ax8.grid(axis='y', linestyle='--', alpha=0.7)
@@ -1122,15 +1039,13 @@ def render_summary_results(st_obj, results: Dict, start_date, end_date):
                                         # If all values are zero, set a default range
                                         ax8.set_ylim(-200, 1000)
                                     
-                                    plt.tight_layout()
+                                    fig8.tight_layout()
                                     
                                     try:
                                         # Create the figure with a reasonable DPI
                                         st_obj.pyplot(fig8, dpi=100)
                                     except Exception as e:
                                         st_obj.error(f"Unable to create chart for {source}: {str(e)}")
-                                        # Close the figure to free up memory
-                                        plt.close(fig8)
                                 else:
                                     st_obj.info(f"No data available for {source}")
                         else:
@@ -79,15 +79,8 @@ def render_revenue_tab(st_obj):
         col1, col2 = st_obj.columns([1, 5])
         with col1:
             if st_obj.button("Save Revenue Data"):
-                # Handle any date columns to prevent JSON serialization errors
-                save_df = edited_df.copy()
-                
-                # Convert any datetime columns to string format
-                for col in save_df.columns:
-                    if pd.api.types.is_datetime64_any_dtype(save_df[col]):
-                        save_df[col] = save_df[col].dt.strftime('%m/%d/%Y')
-                
-                save_result = AppController.save_dataframe("Revenue", save_df)
+                # Date columns are written as MM/DD/YYYY by save_csv/save_json
+                save_result = AppController.save_dataframe("Revenue", edited_df)
                 if save_result:
                     st_obj.success("Revenue data saved successfully!")
                     revenue_df = edited_df
@@ -141,10 +134,12 @@ def render_revenue_chart(st_obj, revenue_df):
         # Display the bar chart
         st_obj.subheader("Revenue by Source")
         st_obj.pyplot(bar_chart)
+        plt.close(bar_chart)
         
         # Display the pie chart
         st_obj.subheader("Revenue Distribution")
         st_obj.pyplot(pie_chart)
+        plt.close(pie_chart)
         
         # Sort by amount descending for tables
         sorted_revenue = valid_revenue.sort_values('Amount', ascending=False)
@@ -157,12 +152,9 @@ def render_revenue_chart(st_obj, revenue_df):
             type_summary = sorted_revenue.groupby('Type')['Amount'].sum().reset_index()
             type_summary = type_summary.sort_values('Amount', ascending=False)
             
-            # Format the amount column
-            type_summary['Amount'] = type_summary['Amount'].map('${:,.2f}'.format)
-            
-            # Display as a table
+            # Display as a table, formatting the amount at render time
             st_obj.write("Revenue by Type:")
-            st_obj.table(type_summary)
+            st_obj.table(type_summary.style.format({'Amount': '${:,.2f}'}))
         
         # Total revenue
         total_revenue = sorted_revenue['Amount'].sum()
@@ -171,14 +163,8 @@ def render_revenue_chart(st_obj, revenue_df):
         # Display all revenue sources in a nicely formatted table
         st_obj.write("All Revenue Sources:")
         
-        # Create a copy for display formatting
-        display_df = sorted_revenue.copy()
-        
-        # Format amount column
-        if 'Amount' in display_df.columns:
-            display_df['Amount'] = display_df['Amount'].map('${:,.2f}'.format)
-        
-        st_obj.dataframe(display_df, use_container_width=True)
+        # Keep the amounts numeric so they serialize as a numeric Arrow column
+        st_obj.dataframe(sorted_revenue.style.format({'Amount': '${:,.2f}'}), use_container_width=True)
     
     except Exception as e:
         import traceback
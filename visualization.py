@@ -5,11 +5,13 @@ This module provides functions for creating various plots and visualizations
 used throughout the application.
 """
 
+import io
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
 import numpy as np
 import streamlit as st
+from matplotlib.figure import Figure
 from typing import Dict, List, Tuple, Any, Optional
 
 def format_currency(x, pos):
@@ -24,6 +26,11 @@ def format_number(x, pos):
     """Format axis ticks with thousands separators."""
     return f"{x:,.0f}"
 
+# Tick formatters shared by every axis; they hold no per-plot state, so they
+# are built once rather than on each rerun
+CURRENCY_FORMATTER = mticker.FuncFormatter(format_currency)
+NUMBER_FORMATTER = mticker.FuncFormatter(format_number)
+
 def setup_plot_style(figsize=(10, 6)):
     """Set up a plot with standard styling."""
     fig, ax = plt.subplots(figsize=figsize)
@@ -39,6 +46,103 @@ def setup_plot_style(figsize=(10, 6)):
     
     return fig, ax
 
+def get_session_figure(key: str, figsize=(12, 6)) -> Tuple[plt.Figure, plt.Axes]:
+    """
+    Get a figure kept in the session state, cleared and ready for redrawing.
+    
+    The figure is created once per key and reused on later reruns instead of
+    building a new one with plt.subplots each time. It is not registered with
+    pyplot, so redrawn plots do not pile up as open figures.
+    
+    Args:
+        key: Session state key for the figure
+        figsize: Figure size used when the figure is first created
+        
+    Returns:
+        Tuple of the figure and its (cleared) axes
+    """
+    fig = st.session_state.get(key)
+    if fig is None:
+        fig = Figure(figsize=figsize)
+        st.session_state[key] = fig
+    
+    if fig.axes:
+        ax = fig.axes[0]
+        # Drop any extra axes (e.g. twin axes) left from the previous drawing
+        for extra_ax in fig.axes[1:]:
+            extra_ax.remove()
+        ax.clear()
+    else:
+        ax = fig.add_subplot()
+    
+    return fig, ax
+
+def data_fingerprint(data) -> Tuple:
+    """
+    Content fingerprint of a DataFrame or Series, used to key cached plot images.
+    
+    Args:
+        data: DataFrame or Series holding the plotted values
+        
+    Returns:
+        Hashable tuple identifying the labels and the values in row order
+    """
+    labels = tuple(map(str, data.columns)) if isinstance(data, pd.DataFrame) else (str(data.name),)
+    # Keep the per-row hashes as bytes rather than summing them, so reordered rows
+    # produce a different fingerprint
+    return labels, pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes()
+
+def get_cached_plot_png(key: str, fingerprint) -> Optional[bytes]:
+    """
+    Get a previously rendered plot image if its input data is unchanged.
+    
+    Args:
+        key: Session state key for the plot image
+        fingerprint: Fingerprint of the data the plot is drawn from
+        
+    Returns:
+        PNG bytes, or None if the plot needs to be drawn
+    """
+    cached = st.session_state.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    return None
+
+def cache_plot_png(key: str, fingerprint, fig: plt.Figure, dpi: int = 200) -> bytes:
+    """
+    Render a figure to PNG once and keep the image in the session state.
+    
+    Args:
+        key: Session state key for the plot image
+        fingerprint: Fingerprint of the data the plot is drawn from
+        fig: Figure to render
+        dpi: Resolution of the image (matches st.pyplot's default)
+        
+    Returns:
+        PNG bytes of the rendered figure
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+    png = buffer.getvalue()
+    st.session_state[key] = (fingerprint, png)
+    return png
+
+def month_start_dates(years, months) -> pd.DatetimeIndex:
+    """
+    Build first-of-month dates from year and month columns.
+    
+    Args:
+        years: Sequence of calendar years
+        months: Sequence of months (1-12)
+        
+    Returns:
+        DatetimeIndex with one date per year/month pair
+    """
+    years = np.asarray(years, dtype='int64')
+    months = np.asarray(months, dtype='int64')
+    dates = (years - 1970).astype('datetime64[Y]') + (months - 1).astype('timedelta64[M]')
+    return pd.DatetimeIndex(dates.astype('datetime64[ns]'))
+
 def create_revenue_by_year_source_plot(df: pd.DataFrame) -> plt.Figure:
     """
     Create a stacked bar chart of revenue by year and source.
@@ -55,8 +159,7 @@ def create_revenue_by_year_source_plot(df: pd.DataFrame) -> plt.Figure:
     # (Implementation will depend on your specific data structure)
     
     # Set formatting
-    currency_formatter = mticker.FuncFormatter(format_currency)
-    ax.yaxis.set_major_formatter(currency_formatter)
+    ax.yaxis.set_major_formatter(CURRENCY_FORMATTER)
     
     # Add labels and title
     ax.set_xlabel('Year')
@@ -84,8 +187,7 @@ def create_volume_by_year_exam_plot(df: pd.DataFrame) -> plt.Figure:
     # (Implementation will depend on your specific data structure)
     
     # Set formatting
-    number_formatter = mticker.FuncFormatter(format_number)
-    ax.yaxis.set_major_formatter(number_formatter)
+    ax.yaxis.set_major_formatter(NUMBER_FORMATTER)
     
     # Add labels and title
     ax.set_xlabel('Year')
@@ -114,8 +216,7 @@ def create_revenue_vs_expenses_plot(revenue_df: pd.DataFrame, expenses_df: pd.Da
     # (Implementation will depend on your specific data structure)
     
     # Set formatting
-    currency_formatter = mticker.FuncFormatter(format_currency)
-    ax.yaxis.set_major_formatter(currency_formatter)
+    ax.yaxis.set_major_formatter(CURRENCY_FORMATTER)
     
     # Add labels and title
     ax.set_xlabel('Year')
@@ -182,11 +283,10 @@ def create_equipment_expenses_plot(df: pd.DataFrame) -> Tuple[plt.Figure, plt.Fi
             ax1.grid(axis='y', linestyle='--', alpha=0.7)
             
             # Format y-axis with dollar signs
-            currency_formatter = mticker.FuncFormatter(format_currency)
-            ax1.yaxis.set_major_formatter(currency_formatter)
+            ax1.yaxis.set_major_formatter(CURRENCY_FORMATTER)
             
-            plt.xticks(rotation=45)
-            plt.tight_layout()
+            ax1.tick_params(axis='x', labelrotation=45)
+            fig1.tight_layout()
     except Exception as e:
         # Handle any errors in the visualization
         print(f"Error in equipment cost plot: {str(e)}")
@@ -206,10 +306,9 @@ def create_equipment_expenses_plot(df: pd.DataFrame) -> Tuple[plt.Figure, plt.Fi
         ax2.grid(True, linestyle='--', alpha=0.7)
         
         # Format y-axis with dollar signs
-        currency_formatter = mticker.FuncFormatter(format_currency)
-        ax2.yaxis.set_major_formatter(currency_formatter)
+        ax2.yaxis.set_major_formatter(CURRENCY_FORMATTER)
         
-        plt.tight_layout()
+        fig2.tight_layout()
     except Exception as e:
         # Handle any errors in the visualization
         print(f"Error in depreciation plot: {str(e)}")
@@ -279,10 +378,8 @@ def create_revenue_charts(revenue_df: pd.DataFrame) -> Tuple[plt.Figure, plt.Fig
     bars = ax1.barh(sorted_revenue['Title'], sorted_revenue['Amount'], color='#4ECB71')
     
     # Add amount labels
-    for bar in bars:
-        width = bar.get_width()
-        ax1.text(width * 1.01, bar.get_y() + bar.get_height()/2, 
-                f'${width:,.0f}', va='center')
+    labels = [f'${amount:,.0f}' for amount in sorted_revenue['Amount'].to_numpy()]
+    ax1.bar_label(bars, labels=labels, padding=3)
     
     # Set chart labels and styling
     ax1.set_title('Revenue by Source')
@@ -290,10 +387,9 @@ def create_revenue_charts(revenue_df: pd.DataFrame) -> Tuple[plt.Figure, plt.Fig
     ax1.grid(axis='x', linestyle='--', alpha=0.7)
     
     # Format x-axis with dollar signs
-    currency_formatter = mticker.FuncFormatter(format_currency)
-    ax1.xaxis.set_major_formatter(currency_formatter)
+    ax1.xaxis.set_major_formatter(CURRENCY_FORMATTER)
     
-    plt.tight_layout()
+    fig1.tight_layout()
     
     # Create a pie chart showing revenue distribution
     fig2, ax2 = plt.subplots(figsize=(8, 8))
@@ -319,6 +415,6 @@ def create_revenue_charts(revenue_df: pd.DataFrame) -> Tuple[plt.Figure, plt.Fig
     # Set aspect ratio to be equal so that pie is drawn as a circle
     ax2.axis('equal')
     
-    plt.tight_layout()
+    fig2.tight_layout()
     
     return fig1, fig2 
\ No newline at end of file